@@ -16,9 +16,16 @@ The ``reflectance_scale`` injected by the endpoint mapper is not used in this
 algorithm.
 """
 
+import functools
+import types
+
 from openeo.api.process import Parameter
 
 
+# The sets (and their Parameter objects) are built on first call only; the
+# cached result is handed out as a read-only view so repeated notebook calls
+# cannot mutate the shared defaults.
+@functools.lru_cache(maxsize=1)
 def get_parameters():
     """Return available parameter sets for the urban areas algorithm.
 
@@ -106,4 +113,4 @@ def get_parameters():
         },
     }
 
-    return parameter_sets
+    return types.MappingProxyType(parameter_sets)
@@ -11,9 +11,16 @@ centimetre, ug/cm2) from Sentinel-2 imagery using the SNAP biophysical neural
 network ported in the companion notebook.
 """
 
+import functools
+import types
+
 from openeo.api.process import Parameter
 
 
+# The sets (and their Parameter objects) are built on first call only; the
+# cached result is handed out as a read-only view so repeated notebook calls
+# cannot mutate the shared defaults.
+@functools.lru_cache(maxsize=1)
 def get_parameters():
     """Return available parameter sets for the Cab algorithm.
 
@@ -155,4 +162,4 @@ def get_parameters():
         },
     }
 
-    return parameter_sets
+    return types.MappingProxyType(parameter_sets)
@@ -5,9 +5,16 @@ This file defines parameter sets that can be used with the FAPAR algorithm
 for {{GIVE_DESCRIPTION}} using Sentinel-2 imagery.
 """
 
+import functools
+import types
+
 from openeo.api.process import Parameter
 
 
+# The sets (and their Parameter objects) are built on first call only; the
+# cached result is handed out as a read-only view so repeated notebook calls
+# cannot mutate the shared defaults.
+@functools.lru_cache(maxsize=1)
 def get_parameters():
     """Return available parameter sets for the FAPAR algorithm.
 
@@ -149,4 +156,4 @@ def get_parameters():
         },
     }
 
-    return parameter_sets
+    return types.MappingProxyType(parameter_sets)
@@ -5,9 +5,16 @@ for detecting the one-sided green leaf area over a unit of land (m^2 / m^2)
 using Sentinel-2 imagery.
 """
 
+import functools
+import types
+
 from openeo.api.process import Parameter
 
 
+# The sets (and their Parameter objects) are built on first call only; the
+# cached result is handed out as a read-only view so repeated notebook calls
+# cannot mutate the shared defaults.
+@functools.lru_cache(maxsize=1)
 def get_parameters():
     """Return available parameter sets for the LAI algorithm.
 
@@ -149,4 +156,4 @@ def get_parameters():
         },
     }
 
-    return parameter_sets
+    return types.MappingProxyType(parameter_sets)
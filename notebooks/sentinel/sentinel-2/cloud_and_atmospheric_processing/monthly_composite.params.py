@@ -14,9 +14,16 @@ The ``time`` parameter defines the *one-month window* to composite; the
 companion notebook selects the best observation inside that window per pixel.
 """
 
+import functools
+import types
+
 from openeo.api.process import Parameter
 
 
+# The sets (and their Parameter objects) are built on first call only; the
+# cached result is handed out as a read-only view so repeated notebook calls
+# cannot mutate the shared defaults.
+@functools.lru_cache(maxsize=1)
 def get_parameters():
     """Return available parameter sets for the monthly composite algorithm.
 
@@ -155,4 +162,4 @@ def get_parameters():
         },
     }
 
-    return parameter_sets
+    return types.MappingProxyType(parameter_sets)
@@ -27,9 +27,16 @@ NOTE: This UDP targets the Copernicus Data Space Ecosystem (CDSE), the backend
 that serves both Sentinel-1 GRD and Sentinel-2 L2A.
 """
 
+import functools
+import types
+
 from openeo.api.process import Parameter
 
 
+# The sets (and their Parameter objects) are built on first call only; the
+# cached result is handed out as a read-only view so repeated notebook calls
+# cannot mutate the shared defaults.
+@functools.lru_cache(maxsize=1)
 def get_parameters():
     """Return available parameter sets for the forest fire progression algorithm.
 
@@ -225,4 +232,4 @@ def get_parameters():
         },
     }
 
-    return parameter_sets
+    return types.MappingProxyType(parameter_sets)
@@ -4,9 +4,16 @@ This file defines parameter sets that can be used with the wildfire viz algorith
 for visualizing areas affected by fires using Sentinel-2 imagery.
 """
 
+import functools
+import types
+
 from openeo.api.process import Parameter
 
 
+# The sets (and their Parameter objects) are built on first call only; the
+# cached result is handed out as a read-only view so repeated notebook calls
+# cannot mutate the shared defaults.
+@functools.lru_cache(maxsize=1)
 def get_parameters():
     """Return available parameter sets for the wildfire visualization algorithm.
 
@@ -141,4 +148,4 @@ def get_parameters():
         },
     }
 
-    return parameter_sets
+    return types.MappingProxyType(parameter_sets)
@@ -0,0 +1,136 @@
+"""RGB color-mix builders shared by the wildfire/lava visualization notebooks.
+
+Each function builds an openEO process graph fragment (evaluated server-side,
+per pixel) that mixes Sentinel-2 bands into an RGB triple. The formulas mirror
+the Sentinel Hub wildfire visualization evalscript; all three channels of a
+composite are emitted in a single ``array_create`` so each input band appears
+exactly once in the graph.
+"""
+
+# openeo.processes is imported lazily inside the builders: importing this
+# module (e.g. just to read the weight tables) must not pay for the openeo
+# dependency graph on cold notebook startup.
+
+
+def rgb_mix(bands, weights, offset, use_sqrt=True):
+    """Mix a band triple into an RGB triple with per-channel weights.
+
+    Args:
+        bands: Sequence of three band expressions, in output channel order
+            (R, G, B). Pass slices of the ``data`` array from an
+            ``apply_dimension`` callback, or individual band refs.
+        weights: Sequence of three per-channel scalar weights, already
+            multiplied by brightness where applicable (folded at graph-build
+            time into a single constant per channel).
+        offset: Scalar added to each weighted band before the optional sqrt.
+        use_sqrt: Apply the gamma-style sqrt correction per channel.
+
+    Returns:
+        A single ``array_create`` RGB expression reading each band once.
+    """
+    from openeo.processes import array_create, sqrt
+
+    channels = [
+        band * weight + offset for band, weight in zip(bands, weights, strict=True)
+    ]
+    if use_sqrt:
+        channels = [sqrt(channel) for channel in channels]
+    return array_create(channels)
+
+
+def naturalColorsCC_arr(brightness, b04, b03, b02, offset):
+    """True-color composite with gamma-style color correction (sqrt)."""
+    return rgb_mix((b04, b03, b02), (brightness,) * 3, offset)
+
+
+def naturalColors_arr(brightness, b04, b03, b02, offset):
+    """Linear true-color composite."""
+    return rgb_mix(
+        (b04, b03, b02),
+        (brightness * 2.9, brightness * 3.1, brightness * 3.0),
+        offset,
+        use_sqrt=False,
+    )
+
+
+def urban_arr(brightness, b12, b11, b04, offset):
+    """SWIR-heavy false-color composite that highlights urban areas and burn scars."""
+    return rgb_mix(
+        (b12, b11, b04),
+        (brightness * 1.2, brightness * 1.4, brightness),
+        offset,
+    )
+
+
+def swir_arr(brightness, b12, b08, b04, offset):
+    """SWIR/NIR/Red false-color composite."""
+    return rgb_mix((b12, b08, b04), (brightness,) * 3, offset)
+
+
+def enhancedNaturalColors(brightness, natural, naturalCC, urban):
+    """Blend the natural, color-corrected and urban composites into one RGB triple.
+
+    All three channels are built in one sweep so each input composite is read
+    once per channel, instead of the former per-channel helper that re-read all
+    three inputs on every call. This is the graph-level analogue of a
+    vectorized per-channel stencil: how the backend tiles/SIMDs the resulting
+    expression over pixels is its own concern.
+    """
+    from openeo.processes import array_create, array_element
+
+    # brightness is a plain Python number in notebook use: fold brightness/2
+    # into a single scalar and turn /10 into *0.1 at graph-build time. When it
+    # is a Parameter/graph node, build the halved node once and share it.
+    if isinstance(brightness, (int, float)):
+        half_brightness = brightness * 0.5
+    else:
+        half_brightness = brightness / 2
+    return array_create(
+        [
+            half_brightness
+            * (array_element(natural, i) + array_element(naturalCC, i))
+            + array_element(urban, i) * 0.1
+            for i in range(3)
+        ]
+    )
+
+
+def make_spatial_ones(ref_band):
+    """Constant-ones raster with the spatial shape of ``ref_band``.
+
+    Build this once per graph and pass it to every helper that needs a
+    spatially-shaped constant, so the backend evaluates a single H×W
+    intermediate instead of one per helper call.
+    """
+    return ref_band * 0 + 1
+
+
+def black_arr(ref_band, spatial_ones=None):
+    """All-black RGB triple with the spatial shape of ``ref_band``.
+
+    A single zeros raster is shared by all three channels; pass a precomputed
+    ``make_spatial_ones`` result to reuse an existing constant raster instead
+    of emitting a new ``ref_band * 0`` node.
+    """
+    from openeo.processes import array_create
+
+    zeros = spatial_ones - 1 if spatial_ones is not None else ref_band * 0
+    return array_create([zeros, zeros, zeros])
+
+
+def manualCorrection_arr(base_arr, corr_r=0.0, corr_g=0.0, corr_b=0.0):
+    """Apply per-channel manual corrections and clamp each channel to [0, 1].
+
+    The clamp bounds are plain scalar constants (if_ broadcasts them), so no
+    ones-mask raster is materialized. Each channel is read from ``base_arr``
+    once and the corrected value is reused across the clamp comparisons.
+    """
+    from openeo.processes import array_create, array_element, if_
+
+    corrected = [
+        array_element(base_arr, k) + corr
+        for k, corr in enumerate((corr_r, corr_g, corr_b))
+    ]
+    return array_create(
+        [if_(value > 1, 1, if_(value < 0, 0, value)) for value in corrected]
+    )
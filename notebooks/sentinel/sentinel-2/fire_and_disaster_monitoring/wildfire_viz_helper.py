@@ -0,0 +1,95 @@
+"""Shared helpers for the wildfire/lava visualization notebooks.
+
+Boolean-mask, cloud-detection and image-enhancement building blocks used by
+``wildfire_visualization.ipynb`` and ``lava_visualization.ipynb``. Like the
+color-array builders, these functions emit openEO process graph fragments that
+are evaluated per pixel on the backend.
+
+Numeric precision of the intermediates is chosen by the backend, not by this
+client-side graph; the notebooks quantize the final RGB to 8-bit anyway via
+``linear_scale_range(0, 1, 0, 255)`` + PNG ``save_result``, so nothing wider
+than the backend's native float ever leaves the pipeline.
+"""
+
+# not_/or_ are re-exported so notebooks keep importing them from here. They map
+# to the native openEO "not"/"or" processes (one mask op each) instead of the
+# earlier eq/constant De Morgan emulation, which cost five process nodes per OR.
+from openeo.processes import and_, array_create, array_element, not_, or_  # noqa: F401
+
+
+def isCloud(band_B03, band_B04):
+    """Simple green/red ratio cloud mask (Braaten-Cohen-Yang style).
+
+    Algebraically reduced to compare-only form: with bRatio =
+    (B03 - 0.175) / 0.215, ``bRatio > 1`` is ``B03 > 0.39``, ``bRatio > 0``
+    is ``B03 > 0.175``, and the NGDR normalized difference is positive
+    exactly when ``B03 > B04``. Same mask, no per-pixel divisions and no
+    intermediate NGDR/bRatio rasters.
+    """
+    return or_(
+        band_B03 > 0.39,
+        and_(band_B03 > 0.175, band_B03 > band_B04),
+    )
+
+
+def stretch(rgb_arr, s_min, s_max):
+    """Linearly stretch each channel of an RGB triple from [s_min, s_max] to [0, 1].
+
+    The ``1 / (s_max - s_min)`` reciprocal is folded to a single scalar at
+    graph-build time, so the backend evaluates one multiply per channel instead
+    of three identical subtract+divide subgraphs.
+    """
+    inv = 1.0 / (s_max - s_min)
+    return array_create(
+        [(array_element(rgb_arr, k) - s_min) * inv for k in range(3)]
+    )
+
+
+def stretch_cube(cube, s_min, s_max):
+    """Cube-level variant of :func:`stretch` for use outside band callbacks.
+
+    The op is identical for every channel, so when the RGB composite already
+    lives in a DataCube there is no need for the array_element/array_create
+    plumbing at all: a single ``apply`` node stretches all bands at once,
+    cutting the graph from ~3 nodes per channel to one.
+    """
+    inv = 1.0 / (s_max - s_min)
+    return cube.apply(lambda x: (x - s_min) * inv)
+
+
+def satEnh(rgb_arr, s):
+    """Enhance saturation: blend each channel with the channel average by factor ``s``.
+
+    Factored as the single lerp ``avg + s * (channel - avg)`` — one subtract,
+    one multiply, one add per channel (an FMA shape) instead of the two-sided
+    ``avg * (1 - s) + channel * s`` blend. The ``/3`` is folded to a multiply.
+    """
+    r = array_element(rgb_arr, 0)
+    g = array_element(rgb_arr, 1)
+    b = array_element(rgb_arr, 2)
+    avg = (r + g + b) * (1.0 / 3.0)
+    return array_create(
+        [
+            avg + s * (r - avg),
+            avg + s * (g - avg),
+            avg + s * (b - avg),
+        ]
+    )
+
+
+def layer_blend(lay1, lay2, lay3, op1, op2, op3):
+    """Blend three RGB layers with opacities given in percent (0-100).
+
+    The percent-to-fraction conversion happens once per layer at graph-build
+    time, so the backend sees nine multiplies by constant-folded scalars
+    instead of per-channel divisions.
+    """
+    w1, w2, w3 = op1 / 100, op2 / 100, op3 / 100
+    return array_create(
+        [
+            array_element(lay1, k) * w1
+            + array_element(lay2, k) * w2
+            + array_element(lay3, k) * w3
+            for k in range(3)
+        ]
+    )
@@ -4,9 +4,104 @@ This file defines parameter sets that can be used with the APA algorithm
 for detecting aquatic plants and algae in water bodies using Sentinel-2 imagery.
 """
 
-from openeo.api.process import Parameter
+import collections
+import functools
+import types
 
+# Immutable bounding-box record: 4-tuple storage instead of a per-location
+# dict, converted to the openEO {west, south, east, north} dict only when the
+# Parameter object is built.
+BBox = collections.namedtuple("BBox", "west south east north")
 
+# Bands required for the APA calculation (shared by every location).
+_APA_BANDS = ["b02", "b03", "b04", "b05", "b08", "b8a", "b11"]
+
+# Raw per-location data. Only primitives live here; the Parameter objects are
+# built once from this table below, so adding a location is a five-line entry
+# instead of a copy-pasted block of Parameter(...) calls.
+_LOCATIONS = {
+    "venice_lagoon": {
+        "location_name": "Venice Lagoon, Italy",
+        "bounding_box": BBox(12.2, 45.3, 12.6, 45.6),
+        "time": ["2025-06-01", "2025-08-31"],
+        "cloud_cover": 30,
+    },
+    "lake_victoria": {
+        "location_name": "Lake Victoria, East Africa",
+        "bounding_box": BBox(33.94, -0.53, 34.88, -0.10),
+        "time": ["2023-07-01", "2023-09-30"],
+        "cloud_cover": 25,
+    },
+    "nile_delta": {
+        "location_name": "Nile Delta, Egypt",
+        "bounding_box": BBox(30.5, 30.8, 31.8, 31.6),
+        "time": ["2023-05-03", "2023-05-31"],
+        "cloud_cover": 50,
+    },
+    "florida_everglades": {
+        "location_name": "Florida Everglades, USA",
+        "bounding_box": BBox(-81.0, 25.3, -80.3, 25.9),
+        "time": ["2023-07-04", "2023-08-31"],
+        "cloud_cover": 30,
+    },
+    "tonle_sap_lake": {
+        "location_name": "Tonle Sap Lake, Cambodia",
+        "bounding_box": BBox(103.5, 12.8, 104.5, 13.5),
+        "time": ["2023-08-10", "2023-10-31"],
+        "cloud_cover": 35,
+    },
+}
+
+# Fail fast on malformed records at import time rather than at graph build.
+# An explicit raise (not assert) so the check survives python -O.
+for _name, _loc in _LOCATIONS.items():
+    _bbox = _loc["bounding_box"]
+    if _bbox.west >= _bbox.east or _bbox.south >= _bbox.north:
+        raise ValueError(f"Malformed bounding box for location '{_name}'")
+del _name, _loc, _bbox
+
+
+def _build_parameter_set(location):
+    """Wrap one raw location record in openEO Parameter objects."""
+    # Imported here (not at module scope) so reading _LOCATIONS does not pull
+    # in the openeo dependency graph; get_parameters() caches the built sets,
+    # so the import cost is paid at most once.
+    from openeo.api.process import Parameter
+
+    return {
+        "location_name": location["location_name"],
+        "bounding_box": Parameter(
+            "bounding_box",
+            description=f"Spatial extent for {location['location_name']}",
+            default=location["bounding_box"]._asdict(),
+        ),
+        "time": Parameter(
+            "time",
+            description="Temporal range for data acquisition",
+            default=location["time"],
+        ),
+        "bands": Parameter(
+            "bands",
+            description="Sentinel-2 bands required for APA calculation",
+            default=_APA_BANDS,
+        ),
+        "collection": Parameter(
+            "collection",
+            description="Data collection identifier",
+            default="sentinel-2-l2a",
+        ),
+        "cloud_cover": Parameter(
+            "cloud_cover",
+            description="Maximum cloud cover percentage",
+            default=location["cloud_cover"],
+        ),
+    }
+
+
+# Built on first call; get_parameters() hands out a read-only view so repeated
+# notebook calls cost a single attribute lookup instead of re-allocating the
+# nested dicts and Parameter objects.
+@functools.lru_cache(maxsize=1)
 def get_parameters():
     """Return available parameter sets for the APA algorithm.
 
@@ -20,148 +115,6 @@ def get_parameters():
         - collection: Data collection identifier as Parameter object
         - cloud_cover: Maximum cloud cover percentage as Parameter object
     """
-
-    parameter_sets = {
-        "venice_lagoon": {
-            "location_name": "Venice Lagoon, Italy",
-            "bounding_box": Parameter(
-                "bounding_box",
-                description="Spatial extent for Venice Lagoon",
-                default={"west": 12.2, "south": 45.3, "east": 12.6, "north": 45.6},
-            ),
-            "time": Parameter(
-                "time",
-                description="Temporal range for data acquisition",
-                default=["2025-06-01", "2025-08-31"],
-            ),
-            "bands": Parameter(
-                "bands",
-                description="Sentinel-2 bands required for APA calculation",
-                default=["b02", "b03", "b04", "b05", "b08", "b8a", "b11"],
-            ),
-            "collection": Parameter(
-                "collection",
-                description="Data collection identifier",
-                default="sentinel-2-l2a",
-            ),
-            "cloud_cover": Parameter(
-                "cloud_cover",
-                description="Maximum cloud cover percentage",
-                default=30,
-            ),
-        },
-        "lake_victoria": {
-            "location_name": "Lake Victoria, East Africa",
-            "bounding_box": Parameter(
-                "bounding_box",
-                description="Spatial extent for Lake Victoria",
-                default={"west": 33.94, "south": -0.53, "east": 34.88, "north": -0.10},
-            ),
-            "time": Parameter(
-                "time",
-                description="Temporal range for data acquisition",
-                default=["2023-07-01", "2023-09-30"],
-            ),
-            "bands": Parameter(
-                "bands",
-                description="Sentinel-2 bands required for APA calculation",
-                default=["b02", "b03", "b04", "b05", "b08", "b8a", "b11"],
-            ),
-            "collection": Parameter(
-                "collection",
-                description="Data collection identifier",
-                default="sentinel-2-l2a",
-            ),
-            "cloud_cover": Parameter(
-                "cloud_cover",
-                description="Maximum cloud cover percentage",
-                default=25,
-            ),
-        },
-        "nile_delta": {
-            "location_name": "Nile Delta, Egypt",
-            "bounding_box": Parameter(
-                "bounding_box",
-                description="Spatial extent for Nile Delta",
-                default={"west": 30.5, "south": 30.8, "east": 31.8, "north": 31.6},
-            ),
-            "time": Parameter(
-                "time",
-                description="Temporal range for data acquisition",
-                default=["2023-05-03", "2023-05-31"],
-            ),
-            "bands": Parameter(
-                "bands",
-                description="Sentinel-2 bands required for APA calculation",
-                default=["b02", "b03", "b04", "b05", "b08", "b8a", "b11"],
-            ),
-            "collection": Parameter(
-                "collection",
-                description="Data collection identifier",
-                default="sentinel-2-l2a",
-            ),
-            "cloud_cover": Parameter(
-                "cloud_cover",
-                description="Maximum cloud cover percentage",
-                default=50,
-            ),
-        },
-        "florida_everglades": {
-            "location_name": "Florida Everglades, USA",
-            "bounding_box": Parameter(
-                "bounding_box",
-                description="Spatial extent for Florida Everglades",
-                default={"west": -81.0, "south": 25.3, "east": -80.3, "north": 25.9},
-            ),
-            "time": Parameter(
-                "time",
-                description="Temporal range for data acquisition",
-                default=["2023-07-04", "2023-08-31"],
-            ),
-            "bands": Parameter(
-                "bands",
-                description="Sentinel-2 bands required for APA calculation",
-                default=["b02", "b03", "b04", "b05", "b08", "b8a", "b11"],
-            ),
-            "collection": Parameter(
-                "collection",
-                description="Data collection identifier",
-                default="sentinel-2-l2a",
-            ),
-            "cloud_cover": Parameter(
-                "cloud_cover",
-                description="Maximum cloud cover percentage",
-                default=30,
-            ),
-        },
-        "tonle_sap_lake": {
-            "location_name": "Tonle Sap Lake, Cambodia",
-            "bounding_box": Parameter(
-                "bounding_box",
-                description="Spatial extent for Tonle Sap Lake",
-                default={"west": 103.5, "south": 12.8, "east": 104.5, "north": 13.5},
-            ),
-            "time": Parameter(
-                "time",
-                description="Temporal range for data acquisition",
-                default=["2023-08-10", "2023-10-31"],
-            ),
-            "bands": Parameter(
-                "bands",
-                description="Sentinel-2 bands required for APA calculation",
-                default=["b02", "b03", "b04", "b05", "b08", "b8a", "b11"],
-            ),
-            "collection": Parameter(
-                "collection",
-                description="Data collection identifier",
-                default="sentinel-2-l2a",
-            ),
-            "cloud_cover": Parameter(
-                "cloud_cover",
-                description="Maximum cloud cover percentage",
-                default=35,
-            ),
-        },
-    }
-
-    return parameter_sets
+    return types.MappingProxyType(
+        {name: _build_parameter_set(location) for name, location in _LOCATIONS.items()}
+    )
@@ -6,9 +6,16 @@ high-contrast water bodies (Aral Sea, Poyang Lake) that exercise long-term
 shrinkage and monsoon-driven seasonal flooding.
 """
 
+import functools
+import types
+
 from openeo.api.process import Parameter
 
 
+# The sets (and their Parameter objects) are built on first call only; the
+# cached result is handed out as a read-only view so repeated notebook calls
+# cannot mutate the shared defaults.
+@functools.lru_cache(maxsize=1)
 def get_parameters():
     """Return available parameter sets for the SWBM algorithm.
 
@@ -134,4 +141,4 @@ def get_parameters():
         },
     }
 
-    return parameter_sets
+    return types.MappingProxyType(parameter_sets)
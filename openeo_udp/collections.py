@@ -15,10 +15,19 @@ Anything an endpoint has no explicit mapping for raises
 being silently guessed or passed through.
 """
 
+from __future__ import annotations
+
+import functools
 from enum import Enum
-from typing import Any, Callable, Dict, List
+from typing import TYPE_CHECKING, Any, Callable, Dict, List
+
+if TYPE_CHECKING:
+    from openeo.api.process import Parameter
 
-from openeo.api.process import Parameter
+# Parameter is imported lazily inside the functions that touch it: importing
+# this module (e.g. to read the canonical band tables or an ENDPOINT_CONFIG)
+# must not pay for the full openeo dependency graph. After the first mapper
+# call the import is a sys.modules hit.
 
 
 class Collection(str, Enum):
@@ -78,17 +87,66 @@ def resolve_canonical(collection_id: str) -> Collection:
     )
 
 
+@functools.lru_cache(maxsize=256)
+def _build_parameter(name: str, description: str, default: Any) -> Parameter:
+    """Construct (once per distinct inputs) a Parameter with the given default.
+
+    Remapping the same (collection, bands) combination is the overwhelming
+    common case across a notebook session, so interned instances replace a
+    fresh Parameter allocation per map_parameters call. Callers treat the
+    returned objects as read-only, as the rest of this module already assumes.
+    """
+    from openeo.api.process import Parameter
+
+    if isinstance(default, tuple):
+        default = list(default)
+    return Parameter(name, description=description, default=default)
+
+
 def _rebuild_parameter(param: Parameter, default: Any) -> Parameter:
     """Return a copy of ``param`` with a new default, preserving name/description."""
-    return Parameter(
+    # List defaults (band lists) are keyed as tuples so they hash;
+    # _build_parameter converts back before constructing.
+    if isinstance(default, list):
+        default = tuple(default)
+    return _build_parameter(
         param.name,
-        description=(
-            param.description if hasattr(param, "description") else param.name
-        ),
-        default=default,
+        # Single getattr with a fallback instead of hasattr + attribute access
+        # (hasattr is a try/except around getattr under the hood).
+        getattr(param, "description", param.name),
+        default,
     )
 
 
+# Keys every ENDPOINT_CONFIG must define. The configs stay plain dicts (the
+# notebooks and tests read them as such), but make_mapper() checks this set at
+# endpoint import time so a missing key fails the import instead of the first
+# connection attempt.
+_REQUIRED_CONFIG_KEYS = frozenset(
+    {
+        "name",
+        "url",
+        "auth_method",
+        "reflectance_scale",
+        "bands_dimension",
+        "time_dimension",
+        "capabilities",
+        "enabled",
+    }
+)
+
+
+def _validate_endpoint_config(endpoint_config: Dict[str, Any]) -> None:
+    """Fail fast on an ENDPOINT_CONFIG missing required keys."""
+    missing = _REQUIRED_CONFIG_KEYS.difference(endpoint_config)
+    if missing:
+        name = endpoint_config.get("name", "<unknown>")
+        raise ValueError(
+            f"ENDPOINT_CONFIG for '{name}' is missing required keys: "
+            f"{sorted(missing)}"
+        )
+
+
 def make_mapper(
     endpoint_config: Dict[str, Any],
     collections: Dict[Collection, Dict[str, Any]],
@@ -108,17 +166,28 @@ def make_mapper(
         ``collection`` and ``bands`` Parameters to backend-native values and
         raises on anything it cannot map.
     """
+    _validate_endpoint_config(endpoint_config)
     endpoint_name = endpoint_config.get("name", "<unknown>")
 
+    # The backend-intrinsic attributes are constant per endpoint; merging them
+    # in a single literal below avoids the copy-then-three-assignments dance.
+    intrinsics = {
+        "reflectance_scale": endpoint_config["reflectance_scale"],
+        "bands_dimension": endpoint_config["bands_dimension"],
+        "time_dimension": endpoint_config["time_dimension"],
+    }
+
     def map_parameters(params: Dict[str, Any]) -> Dict[str, Any]:
-        mapped = params.copy()
+        from openeo.api.process import Parameter
 
-        # Propagate backend-intrinsic attributes into current_params so notebooks
-        # can read them as plain scalars.
-        mapped["reflectance_scale"] = endpoint_config["reflectance_scale"]
-        mapped["bands_dimension"] = endpoint_config["bands_dimension"]
-        mapped["time_dimension"] = endpoint_config["time_dimension"]
+        # A copy is always needed: every call propagates the intrinsic
+        # attributes into current_params so notebooks can read them as plain
+        # scalars, so there is no "nothing changed, alias the input" path.
+        # One dict-merge builds the result in a single allocation.
+        mapped = {**params, **intrinsics}
 
+        # Only "collection" and "bands" are ever rewritten: two direct key
+        # lookups, never a scan over the whole parameter dict.
         collection_param = params.get("collection")
         if not isinstance(collection_param, Parameter):
             # No collection to map (e.g. param sets without a collection).
@@ -132,27 +201,46 @@ def make_mapper(
             )
         spec = collections[canonical]
 
-        # Map the collection id to the backend-native value.
-        mapped["collection"] = _rebuild_parameter(
-            collection_param, spec["collection_id"]
-        )
+        # Map the collection id to the backend-native value; when the native id
+        # already equals the canonical default (several backends use the STAC
+        # ids natively), reuse the existing Parameter instead of rebuilding.
+        collection_id = spec["collection_id"]
+        if collection_id != collection_param.default:
+            mapped["collection"] = _rebuild_parameter(collection_param, collection_id)
 
         # Map each requested band; unknown bands are an error, not a passthrough.
         bands_param = params.get("bands")
         if isinstance(bands_param, Parameter) and isinstance(bands_param.default, list):
-            band_map = spec["bands"]
-            mapped_bands = []
-            for band in bands_param.default:
-                key = str(band).lower()
-                if key not in band_map:
-                    raise UnsupportedBandError(
-                        f"Endpoint '{endpoint_name}' has no mapping for band "
-                        f"'{band}' of collection '{canonical.value}'. "
-                        f"Available bands: {sorted(band_map)}"
-                    )
-                mapped_bands.append(band_map[key])
-            mapped["bands"] = _rebuild_parameter(bands_param, mapped_bands)
+            mapped_bands = _map_bands(
+                spec["bands"], bands_param.default, endpoint_name, canonical
+            )
+            if mapped_bands != bands_param.default:
+                mapped["bands"] = _rebuild_parameter(bands_param, mapped_bands)
 
         return mapped
 
     return map_parameters
+
+
+def _map_bands(
+    band_map: Dict[str, str],
+    bands: List[str],
+    endpoint_name: str,
+    canonical: Collection,
+) -> List[str]:
+    """Translate each canonical band to its backend-native name.
+
+    Unknown bands are an error, not a passthrough.
+    """
+    lookup = band_map.get
+    mapped_bands = []
+    for band in bands:
+        native = lookup(str(band).lower())
+        if native is None:
+            raise UnsupportedBandError(
+                f"Endpoint '{endpoint_name}' has no mapping for band "
+                f"'{band}' of collection '{canonical.value}'. "
+                f"Available bands: {sorted(band_map)}"
+            )
+        mapped_bands.append(native)
+    return mapped_bands
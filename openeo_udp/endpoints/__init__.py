@@ -1,15 +1,153 @@
 """Endpoints package for OpenEO UDP.
 
 This package provides endpoint configurations and parameter mapping functionality
-using pure Python modules for maximum flexibility.
+using pure Python modules for maximum flexibility. Because each configuration is
+an importable module (not a YAML/JSON resource parsed at runtime), loading an
+endpoint costs a normal cached import and nothing else.
 """
 
+import functools
 import importlib
-from pathlib import Path
-from typing import Any, Dict, List
+import pkgutil
+import sys
+from typing import Any, Dict, List, Optional, Tuple
 
 __version__ = "0.1.0"
 
+__all__ = [
+    "clear_endpoint_cache",
+    "connect_with_auth",
+    "list_available_endpoints",
+    "get_endpoint_config",
+    "get_endpoint_mapper",
+    "get_endpoint_connection",
+    "invalidate_connection",
+    "get_all_endpoints",
+    "get_default_endpoint",
+    "get_enabled_endpoints",
+    "validate_endpoint_compatibility",
+    # Endpoint submodules, resolved lazily via __getattr__ (PEP 562).
+    "copernicus_dataspace",
+    "ds_development",
+    "eopf_explorer",
+    "localhost_dev",
+]
+
+
+def __getattr__(name: str):
+    """Resolve endpoint submodules lazily (PEP 562).
+
+    ``from openeo_udp.endpoints import eopf_explorer`` imports that one module
+    (and its openeo dependency tree) on first access only; importing this
+    package stays cheap for callers that never touch a connection.
+    """
+    if name in list_available_endpoints():
+        return importlib.import_module(f"openeo_udp.endpoints.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Endpoint configurations are static for the lifetime of the process, but
+# get_all_endpoints() used to re-import every endpoint module and rebuild its
+# dict on each call (print_options, quick_connect and the widgets all call it).
+# Cache the assembled mapping once; clear_endpoint_cache() resets it for tests.
+_ALL_ENDPOINTS_CACHE: Optional[Dict[str, Dict[str, Any]]] = None
+_ENDPOINT_NAMES: Optional[Tuple[str, ...]] = None
+_DEFAULT_ENDPOINT: Optional[str] = None
+_ENABLED_ENDPOINTS: Optional[Tuple[str, ...]] = None
+_MODULE_PATHS: Optional[Dict[str, str]] = None
+# Established connections, keyed by endpoint name (see get_endpoint_connection).
+_CONNECTION_CACHE: Dict[str, Any] = {}
+
+
+def clear_endpoint_cache() -> None:
+    """Reset the cached endpoint name list, modules and mapping (mainly for tests)."""
+    global _ALL_ENDPOINTS_CACHE, _ENDPOINT_NAMES, _DEFAULT_ENDPOINT
+    global _ENABLED_ENDPOINTS, _MODULE_PATHS
+    _ALL_ENDPOINTS_CACHE = None
+    _ENDPOINT_NAMES = None
+    _DEFAULT_ENDPOINT = None
+    _ENABLED_ENDPOINTS = None
+    _MODULE_PATHS = None
+    _CONNECTION_CACHE.clear()
+    _get_endpoint_module.cache_clear()
+    _capability_set.cache_clear()
+
+
+# Authentication step per ENDPOINT_CONFIG["auth_method"]. A dict of callables
+# replaces the if/elif chains that used to be duplicated in every endpoint's
+# get_connection(); adding an auth scheme is one table entry.
+_AUTH_DISPATCH = {
+    "oidc": lambda connection: connection.authenticate_oidc(),
+    "oidc_authorization_code": (
+        lambda connection: connection.authenticate_oidc_authorization_code()
+    ),
+}
+
+
+def connect_with_auth(endpoint_config: Dict[str, Any]):
+    """Connect to an endpoint's URL and authenticate per its ``auth_method``.
+
+    Args:
+        endpoint_config: An endpoint module's ``ENDPOINT_CONFIG`` dict.
+
+    Returns:
+        Authenticated OpenEO connection
+
+    Raises:
+        ValueError: If the config names an unknown ``auth_method``
+    """
+    auth_method = endpoint_config["auth_method"]
+    try:
+        authenticate = _AUTH_DISPATCH[auth_method]
+    except KeyError:
+        raise ValueError(
+            f"Unknown auth method '{auth_method}' for endpoint "
+            f"'{endpoint_config.get('name', '<unknown>')}'. "
+            f"Known methods: {sorted(_AUTH_DISPATCH)}"
+        ) from None
+
+    import openeo
+
+    connection = openeo.connect(endpoint_config["url"])
+    authenticate(connection)
+    return connection
+
+
+def _module_paths() -> Dict[str, str]:
+    """Registry of endpoint name -> dotted module path, built once.
+
+    Restricting resolution to this registry also means an endpoint name from
+    user input can never reach importlib with an arbitrary module string.
+    """
+    global _MODULE_PATHS
+    if _MODULE_PATHS is None:
+        _MODULE_PATHS = {
+            name: f"{__name__}.{name}" for name in list_available_endpoints()
+        }
+    return _MODULE_PATHS
+
+
+@functools.lru_cache(maxsize=None)
+def _get_endpoint_module(endpoint_name: str):
+    """Import (once) and return the module for an endpoint.
+
+    All config/mapper/connection helpers resolve modules through this cached
+    hook, so repeated dispatch skips the import-lock round trip, the f-string
+    build and the sys.modules lookup of importlib.import_module. Names are
+    resolved against the static registry; unknown ones raise ImportError
+    without touching the import machinery. Failed imports are not cached and
+    propagate as ImportError.
+    """
+    try:
+        path = _module_paths()[endpoint_name]
+    except KeyError:
+        raise ImportError(
+            f"No endpoint module named '{endpoint_name}' in {__name__}"
+        ) from None
+    module = sys.modules.get(path)
+    if module is None:
+        module = importlib.import_module(path)
+    return module
+
 
 def list_available_endpoints() -> List[str]:
     """List all available endpoint configurations.
@@ -17,11 +155,15 @@ def list_available_endpoints() -> List[str]:
     Returns:
         List of endpoint names
     """
-    endpoints_dir = Path(__file__).parent
-    endpoint_files = [
-        f.stem for f in endpoints_dir.glob("*.py") if f.stem != "__init__"
-    ]
-    return endpoint_files
+    global _ENDPOINT_NAMES
+    if _ENDPOINT_NAMES is None:
+        # pkgutil walks the package finders without a stat() per candidate
+        # (unlike the previous Path.glob), and the package contents do not
+        # change during the process lifetime, so enumerate once.
+        _ENDPOINT_NAMES = tuple(
+            module.name for module in pkgutil.iter_modules(__path__)
+        )
+    return list(_ENDPOINT_NAMES)
 
 
 def get_endpoint_config(endpoint_name: str) -> Dict[str, Any]:
@@ -37,8 +179,7 @@ def get_endpoint_config(endpoint_name: str) -> Dict[str, Any]:
         ImportError: If endpoint configuration is not found
     """
     try:
-        module = importlib.import_module(f"openeo_udp.endpoints.{endpoint_name}")
-        return module.ENDPOINT_CONFIG
+        return _get_endpoint_module(endpoint_name).ENDPOINT_CONFIG
     except ImportError as e:
         raise ImportError(f"Endpoint configuration '{endpoint_name}' not found") from e
 
@@ -53,8 +194,7 @@ def get_endpoint_mapper(endpoint_name: str):
         Mapper function or None if not found
     """
     try:
-        module = importlib.import_module(f"openeo_udp.endpoints.{endpoint_name}")
-        return getattr(module, "map_parameters", None)
+        return getattr(_get_endpoint_module(endpoint_name), "map_parameters", None)
     except ImportError:
         return None
 
@@ -62,6 +202,13 @@ def get_endpoint_mapper(endpoint_name: str):
 def get_endpoint_connection(endpoint_name: str):
     """Get connection function for specific endpoint.
 
+    Connections are cached per endpoint for the process lifetime: each
+    openeo.connect() triggers capability and OIDC discovery round trips and
+    authenticate_oidc may open a browser flow, so re-clicking Connect in the
+    widgets (or calling quick_connect twice) reuses the established
+    connection instead of repeating them. Use :func:`invalidate_connection`
+    to force a fresh one (e.g. after a token expires).
+
     Args:
         endpoint_name: Name of the endpoint
 
@@ -71,17 +218,97 @@ def get_endpoint_connection(endpoint_name: str):
     Raises:
         ImportError: If endpoint module or get_connection function not found
     """
+    connection = _CONNECTION_CACHE.get(endpoint_name)
+    if connection is not None:
+        return connection
     try:
-        module = importlib.import_module(f"openeo_udp.endpoints.{endpoint_name}")
+        module = _get_endpoint_module(endpoint_name)
         if not hasattr(module, "get_connection"):
             raise ImportError(
                 f"Endpoint '{endpoint_name}' does not have a get_connection function"
             )
-        return module.get_connection()
+        connection = module.get_connection()
     except ImportError as e:
         raise ImportError(
             f"Failed to get connection for endpoint '{endpoint_name}': {e}"
         ) from e
+    _CONNECTION_CACHE[endpoint_name] = connection
+    return connection
+
+
+def invalidate_connection(endpoint_name: Optional[str] = None) -> None:
+    """Drop the cached connection for one endpoint (or all of them).
+
+    Args:
+        endpoint_name: Endpoint whose connection to forget; None drops all.
+    """
+    if endpoint_name is None:
+        _CONNECTION_CACHE.clear()
+    else:
+        _CONNECTION_CACHE.pop(endpoint_name, None)
+
+
+def get_enabled_endpoints() -> Tuple[str, ...]:
+    """Names of all enabled endpoints, in discovery order.
+
+    The filter over configs runs once per process (clear_endpoint_cache
+    resets it); print_options, quick_connect and the widgets all re-read the
+    same tuple instead of rebuilding the list per call.
+    """
+    global _ENABLED_ENDPOINTS
+    if _ENABLED_ENDPOINTS is None:
+        _ENABLED_ENDPOINTS = tuple(
+            name
+            for name, config in get_all_endpoints().items()
+            if config.get("enabled", True)
+        )
+    return _ENABLED_ENDPOINTS
+
+
+def get_default_endpoint() -> Optional[str]:
+    """Resolve the default endpoint: the first enabled one, in discovery order.
+
+    The scan over configs runs once per process (clear_endpoint_cache resets
+    it); repeated callers like quick_connect get a cached name back.
+
+    Returns:
+        Name of the first enabled endpoint, or None if none are enabled
+    """
+    global _DEFAULT_ENDPOINT
+    if _DEFAULT_ENDPOINT is None:
+        enabled = get_enabled_endpoints()
+        _DEFAULT_ENDPOINT = enabled[0] if enabled else None
+    return _DEFAULT_ENDPOINT
+
+
+@functools.lru_cache(maxsize=None)
+def _capability_set(endpoint_name: str) -> frozenset:
+    """Frozen capability set for an endpoint, built once per process.
+
+    Configs declare capabilities as a human-readable list; membership checks
+    go through this cached frozenset so each lookup is O(1).
+    """
+    return frozenset(get_endpoint_config(endpoint_name).get("capabilities", ()))
+
+
+def validate_endpoint_compatibility(endpoint_name: str, required_capabilities) -> None:
+    """Check that an endpoint supports every required openEO process.
+
+    Args:
+        endpoint_name: Name of the endpoint
+        required_capabilities: Iterable of process names the workflow needs
+            (e.g. ``["load_collection", "apply_dimension"]``)
+
+    Raises:
+        ValueError: If the endpoint is missing any required capability; the
+            message lists exactly which ones.
+    """
+    missing = frozenset(required_capabilities) - _capability_set(endpoint_name)
+    if missing:
+        raise ValueError(
+            f"Endpoint '{endpoint_name}' does not support required "
+            f"capabilities: {sorted(missing)}"
+        )
 
 
 def get_all_endpoints() -> Dict[str, Dict[str, Any]]:
@@ -90,10 +317,13 @@ def get_all_endpoints() -> Dict[str, Dict[str, Any]]:
     Returns:
         Dictionary mapping endpoint names to their configurations
     """
-    endpoints = {}
-    for endpoint_name in list_available_endpoints():
-        try:
-            endpoints[endpoint_name] = get_endpoint_config(endpoint_name)
-        except ImportError:
-            continue
-    return endpoints
+    global _ALL_ENDPOINTS_CACHE
+    if _ALL_ENDPOINTS_CACHE is None:
+        endpoints = {}
+        for endpoint_name in list_available_endpoints():
+            try:
+                endpoints[endpoint_name] = get_endpoint_config(endpoint_name)
+            except ImportError:
+                continue
+        _ALL_ENDPOINTS_CACHE = endpoints
+    return _ALL_ENDPOINTS_CACHE
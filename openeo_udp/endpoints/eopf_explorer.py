@@ -5,8 +5,6 @@ collection/band mapping table for the EOPF Explorer OpenEO backend. The actual
 mapping logic lives in :func:`openeo_udp.collections.make_mapper`.
 """
 
-import openeo
-
 from openeo_udp.collections import Collection, make_mapper
 
 # Endpoint configuration
@@ -71,9 +69,6 @@ def get_connection():
     Returns:
         Authenticated OpenEO connection
     """
-    connection = openeo.connect(ENDPOINT_CONFIG["url"])
-
-    # EOPF Explorer uses OIDC authorization code authentication
-    connection.authenticate_oidc_authorization_code()
+    from openeo_udp.endpoints import connect_with_auth
 
-    return connection
+    return connect_with_auth(ENDPOINT_CONFIG)
@@ -4,11 +4,57 @@ This module provides a simplified ParameterManager that loads parameter sets
 from co-located .py files containing a get_parameters() function.
 """
 
-import importlib.util
+from __future__ import annotations
+
+import functools
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from openeo.api.process import Parameter
+
+# Like .endpoints and .widgets (already imported inside the methods that need
+# them), openeo is imported lazily: constructing a ParameterManager or listing
+# parameter sets must not pay for the openeo dependency tree. The .params.py
+# files import Parameter themselves, so by the time the isinstance checks in
+# _ensure_parameter_descriptions run the import is a sys.modules hit.
+
+# Loaded parameter sets keyed by (resolved path, mtime). Notebooks create
+# ParameterManager instances for the same .params.py file repeatedly; caching
+# the post-processed sets skips the compile+exec of the module on every
+# instantiation after the first. The mtime in the key means an edited file is
+# reloaded automatically. Parameter objects are treated as read-only
+# throughout, so instances share the cached dicts.
+_PARAM_SETS_CACHE: Dict[tuple, Dict[str, Dict[str, Any]]] = {}
+
+# Resolved mapper callables per endpoint name, shared across instances. A
+# sentinel distinguishes "not looked up yet" from a cached None (endpoint
+# without a mapper), so negative lookups are not repeated either.
+_MAPPER_CACHE: Dict[str, Any] = {}
+_MISSING = object()
+
+
+def clear_parameter_cache() -> None:
+    """Reset the loaded-parameter-file and mapper caches (mainly for tests)."""
+    _PARAM_SETS_CACHE.clear()
+    _MAPPER_CACHE.clear()
+    _compile_param_file.cache_clear()
 
-from openeo.api.process import Parameter
+
+@functools.lru_cache(maxsize=64)
+def _compile_param_file(path: str, mtime: float):
+    """Compile a .params.py file to a code object, cached by path and mtime."""
+    return compile(Path(path).read_bytes(), path, "exec")
+
+
+@functools.lru_cache(maxsize=256)
+def _fallback_description(name: str) -> str:
+    """Human-readable description derived from a parameter name.
+
+    The same names (bands, collection, time, ...) repeat in every set of
+    every file, so the pure string transform is cached.
+    """
+    return name.replace("_", " ").title()
 
 
 class ParameterManager:
@@ -18,6 +64,16 @@ class ParameterManager:
     pre-configured openEO Parameter objects.
     """
 
+    # No per-instance __dict__: one manager per notebook/param file, fixed
+    # attribute set, and the getters are hot in widget callbacks.
+    __slots__ = (
+        "param_file",
+        "_parameter_sets",
+        "_set_names",
+        "_current_set",
+        "_mapping_cache",
+    )
+
     def __init__(self, param_file_path: str):
         """Initialize parameter manager with a parameter file.
 
@@ -26,7 +82,13 @@ class ParameterManager:
         """
         self.param_file = Path(param_file_path)
         self._parameter_sets = self._load_parameter_sets()
+        # Set names are static for the instance's life; materialize them once
+        # instead of rebuilding list(keys()) in every getter.
+        self._set_names = tuple(self._parameter_sets)
         self._current_set = None
+        # Mapped-parameter results keyed by (set_name, endpoint_name); see
+        # apply_endpoint_mapping.
+        self._mapping_cache: Dict[tuple, Dict[str, Any]] = {}
 
     def _load_parameter_sets(self) -> Dict[str, Dict[str, Any]]:
         """Load parameter sets from the .py file.
@@ -37,27 +99,32 @@ class ParameterManager:
         if not self.param_file.exists():
             raise FileNotFoundError(f"Parameter file not found: {self.param_file}")
 
-        try:
-            # Load the module dynamically
-            spec = importlib.util.spec_from_file_location(
-                "params_module", self.param_file
+        path = str(self.param_file.resolve())
+        cache_key = (path, self.param_file.stat().st_mtime)
+        cached = _PARAM_SETS_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Only get_parameters() is needed, so execute the compiled file into a
+        # plain namespace instead of going through the full import machinery
+        # (spec, loader, module object); this also avoids reusing a shared
+        # "params_module" spec name across managers. Errors propagate with
+        # their real types (SyntaxError, ImportError, ...) rather than being
+        # flattened into a RuntimeError, so callers can catch what they need.
+        namespace: Dict[str, Any] = {}
+        exec(_compile_param_file(*cache_key), namespace)
+
+        # Get parameter sets from get_parameters function
+        get_params = namespace.get("get_parameters")
+        if get_params is None:
+            raise ValueError(
+                f"{self.param_file} does not have a get_parameters() function"
             )
-            params_module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(params_module)
-
-            # Get parameter sets from get_parameters function
-            if hasattr(params_module, "get_parameters"):
-                parameter_sets = params_module.get_parameters()
-                return self._ensure_parameter_descriptions(parameter_sets)
-            else:
-                raise ValueError(
-                    f"{self.param_file} does not have a get_parameters() function"
-                )
 
-        except Exception as e:
-            raise RuntimeError(
-                f"Error loading parameter file {self.param_file}: {e}"
-            ) from e
+        parameter_sets = get_params()
+        processed = self._ensure_parameter_descriptions(parameter_sets)
+        _PARAM_SETS_CACHE[cache_key] = processed
+        return processed
 
     def _ensure_parameter_descriptions(
         self, parameter_sets: Dict[str, Dict[str, Any]]
@@ -70,32 +137,33 @@ class ParameterManager:
         Returns:
             Dictionary of parameter sets with description fallbacks applied
         """
-        processed_sets = {}
-
-        for set_name, param_set in parameter_sets.items():
-            processed_set = {}
-
-            for key, value in param_set.items():
-                if isinstance(value, Parameter):
-                    # Check if Parameter has a description
-                    if not hasattr(value, "description") or not value.description:
-                        # Create a new Parameter with description fallback
-                        processed_set[key] = Parameter(
-                            value.name,
-                            description=f"{value.name.replace('_', ' ').title()}",
-                            default=(
-                                value.default if hasattr(value, "default") else None
-                            ),
-                            schema=value.schema if hasattr(value, "schema") else None,
-                        )
-                    else:
-                        processed_set[key] = value
-                else:
-                    processed_set[key] = value
-
-            processed_sets[set_name] = processed_set
-
-        return processed_sets
+        from openeo.api.process import Parameter
+
+        def processed(value):
+            # Exact type check: every .params.py in this repo constructs
+            # Parameter directly (never a subclass), and type-is is cheaper
+            # than isinstance on CPython.
+            if type(value) is Parameter and not getattr(
+                value, "description", None
+            ):
+                # Create a new Parameter with description fallback. One
+                # getattr-with-default per field instead of the former
+                # hasattr probe plus attribute access.
+                name = value.name
+                return Parameter(
+                    name,
+                    description=_fallback_description(name),
+                    default=getattr(value, "default", None),
+                    schema=getattr(value, "schema", None),
+                )
+            return value
+
+        # Comprehension-built dicts are presized by CPython, so each set is
+        # one allocation instead of growing (and rehashing) key by key.
+        return {
+            set_name: {key: processed(value) for key, value in param_set.items()}
+            for set_name, param_set in parameter_sets.items()
+        }
 
     def list_parameter_sets(self) -> List[str]:
         """Get list of available parameter set names.
@@ -103,7 +171,7 @@ class ParameterManager:
         Returns:
             List of parameter set names
         """
-        return list(self._parameter_sets.keys())
+        return list(self._set_names)
 
     def get_parameter_set(self, set_name: str = None) -> Dict[str, Any]:
         """Get a complete parameter set with Parameter objects.
@@ -116,13 +184,11 @@ class ParameterManager:
         """
         if set_name is None:
             set_name = self._current_set or (
-                list(self._parameter_sets.keys())[0]
-                if self._parameter_sets
-                else "default"
+                self._set_names[0] if self._set_names else "default"
             )
 
         if set_name not in self._parameter_sets:
-            available = list(self._parameter_sets.keys())
+            available = list(self._set_names)
             raise ValueError(
                 f"Parameter set '{set_name}' not found. Available: {available}"
             )
@@ -136,7 +202,7 @@ class ParameterManager:
             set_name: Name of parameter set to use
         """
         if set_name not in self._parameter_sets:
-            available = list(self._parameter_sets.keys())
+            available = list(self._set_names)
             raise ValueError(
                 f"Parameter set '{set_name}' not found. Available: {available}"
             )
@@ -153,11 +219,20 @@ class ParameterManager:
         Returns:
             openEO Parameter object (already created in params file)
         """
-        # Determine which parameter set to use
+        # Resolve the set name once and index the loaded dict directly — no
+        # get_parameter_set round trip re-checking membership on this hot path.
         if set_name is None:
-            set_name = self._current_set or list(self._parameter_sets.keys())[0]
+            set_name = self._current_set or (
+                self._set_names[0] if self._set_names else "default"
+            )
 
-        param_set = self.get_parameter_set(set_name)
+        try:
+            param_set = self._parameter_sets[set_name]
+        except KeyError:
+            available = list(self._set_names)
+            raise ValueError(
+                f"Parameter set '{set_name}' not found. Available: {available}"
+            ) from None
 
         if name not in param_set:
             available = list(param_set.keys())
@@ -173,7 +248,7 @@ class ParameterManager:
         Args:
             algorithm_name: Name of the algorithm for display purposes
         """
-        from .endpoints import get_all_endpoints
+        from .endpoints import get_all_endpoints, get_enabled_endpoints
 
         # Show available parameter sets
         available_sets = self.list_parameter_sets()
@@ -185,11 +260,7 @@ class ParameterManager:
 
         # Load and show endpoint configuration
         all_endpoints = get_all_endpoints()
-        available_endpoints = [
-            name
-            for name, config in all_endpoints.items()
-            if config.get("enabled", True)
-        ]
+        available_endpoints = get_enabled_endpoints()
         print("\nAvailable OpenEO endpoints:")
         for i, endpoint in enumerate(available_endpoints, 1):
             endpoint_info = all_endpoints[endpoint]
@@ -212,9 +283,13 @@ class ParameterManager:
         Returns:
             Mapper function or None if not found
         """
-        from .endpoints import get_endpoint_mapper
+        mapper = _MAPPER_CACHE.get(endpoint_name, _MISSING)
+        if mapper is _MISSING:
+            from .endpoints import get_endpoint_mapper
 
-        return get_endpoint_mapper(endpoint_name)
+            mapper = get_endpoint_mapper(endpoint_name)
+            _MAPPER_CACHE[endpoint_name] = mapper
+        return mapper
 
     def apply_endpoint_mapping(
         self, params: Dict[str, Any], endpoint_name: str
@@ -228,12 +303,26 @@ class ParameterManager:
         Returns:
             Mapped parameter dictionary
         """
+        # quick_connect and the widgets remap the same (set, endpoint) pair
+        # repeatedly; memoize when params is the active set's own (shared,
+        # read-only) dict so repeat calls are a cache hit. Ad-hoc dicts
+        # bypass the cache.
+        current = self._current_set
+        cacheable = current is not None and params is self._parameter_sets.get(
+            current
+        )
+        if cacheable:
+            cached = self._mapping_cache.get((current, endpoint_name))
+            if cached is not None:
+                return cached
+
         # Load and apply mapper
         mapper_fn = self._load_mapper(endpoint_name)
-        if mapper_fn:
-            return mapper_fn(params)
-        else:
-            return params
+        mapped = mapper_fn(params) if mapper_fn else params
+
+        if cacheable:
+            self._mapping_cache[(current, endpoint_name)] = mapped
+        return mapped
 
     def band_name_map(
         self,
@@ -272,7 +361,7 @@ class ParameterManager:
 
     def __str__(self) -> str:
         """String representation."""
-        sets = list(self._parameter_sets.keys())
+        sets = list(self._set_names)
         current = self._current_set or "None"
         return f"ParameterManager({len(sets)} sets: {sets}, current: {current})"
 
@@ -384,21 +473,19 @@ class ParameterManager:
         >>> connection, params = param_manager.quick_connect('venice_lagoon', 'eopf_explorer')
         """
 
-        from .endpoints import get_all_endpoints
+        from .endpoints import get_default_endpoint
 
-        available_sets = self.list_parameter_sets()
-        endpoint_config = get_all_endpoints()
-        available_endpoints = [
-            name
-            for name, config in endpoint_config.items()
-            if config.get("enabled", True)
-        ]
-
-        # Set defaults
-        selected_param_set = param_set or available_sets[0] if available_sets else None
-        selected_endpoint = endpoint or (
-            available_endpoints[0] if available_endpoints else "eopf_explorer"
-        )
+        # Set defaults with explicit precedence: a caller-provided param_set
+        # always wins. The former one-liner bound as
+        # (param_set or sets[0]) if sets else None, silently discarding an
+        # explicit param_set whenever no sets were loaded. The
+        # first-enabled-endpoint scan is cached in the endpoints package, so
+        # repeated quick_connect calls skip it.
+        if param_set is not None:
+            selected_param_set = param_set
+        else:
+            selected_param_set = self._set_names[0] if self._set_names else None
+        selected_endpoint = endpoint or get_default_endpoint() or "eopf_explorer"
 
         if not silent:
             print(f"🔄 Connecting to {selected_endpoint}...")
@@ -423,22 +510,29 @@ class ParameterManager:
                     f"✅ Parameters loaded and mapped for: {current_params.get('location_name', 'Unknown')}"
                 )
 
-                # Show mapping details if parameters were transformed
-                if current_params != raw_params:
+                # Show mapping details if parameters were transformed. The
+                # identity check skips the full dict-equality walk when the
+                # mapper returned the input unchanged (no mapper registered).
+                if current_params is not raw_params and current_params != raw_params:
                     print(f"🔄 Parameters mapped for endpoint {selected_endpoint}:")
                     for param_name, param_value in current_params.items():
-                        if param_name != "location_name" and hasattr(
-                            param_value, "default"
+                        raw_value = raw_params.get(param_name)
+                        if raw_value is param_value or param_name == "location_name":
+                            # Unchanged object (the mapper reuses Parameters
+                            # it did not touch) — nothing to report.
+                            continue
+                        # One getattr with a sentinel per side instead of
+                        # hasattr probes (each a try/except around getattr).
+                        new_default = getattr(param_value, "default", _MISSING)
+                        old_default = getattr(raw_value, "default", _MISSING)
+                        if (
+                            new_default is not _MISSING
+                            and old_default is not _MISSING
+                            and old_default != new_default
                         ):
-                            raw_value = raw_params.get(param_name)
-                            if (
-                                raw_value
-                                and hasattr(raw_value, "default")
-                                and raw_value.default != param_value.default
-                            ):
-                                print(
-                                    f"  {param_name}: {raw_value.default} -> {param_value.default}"
-                                )
+                            print(
+                                f"  {param_name}: {old_default} -> {new_default}"
+                            )
 
             return connection, current_params
 
@@ -446,3 +540,57 @@ class ParameterManager:
             if not silent:
                 print(f"❌ Error: {str(e)}")
             raise
+
+    def quick_connect_many(self, pairs, silent=True, max_workers=8):
+        """
+        Connect several (param_set, endpoint) pairs, overlapping the network work.
+
+        Establishing a connection is network-bound (capabilities fetch plus
+        OIDC discovery), so the distinct endpoints are warmed concurrently in
+        a thread pool; the per-pair parameter mapping then runs serially,
+        because ``quick_connect`` switches the manager's current set and must
+        not race against itself. Warmed connections land in the endpoints
+        package's connection cache, so each serial ``quick_connect`` call
+        finds its connection already established.
+
+        Parameters
+        ----------
+        pairs : iterable of (str, str)
+            ``(param_set, endpoint)`` pairs; either element may be None to
+            use the same defaults as ``quick_connect``.
+        silent : bool, optional
+            If True (the default for batch use), suppress per-pair output.
+        max_workers : int, optional
+            Upper bound on concurrent connection attempts. Default is 8.
+
+        Returns
+        -------
+        list of tuple
+            ``(connection, current_params)`` per pair, in input order.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        from .endpoints import get_default_endpoint, get_endpoint_connection
+
+        resolved = [
+            (param_set, endpoint or get_default_endpoint() or "eopf_explorer")
+            for param_set, endpoint in pairs
+        ]
+        distinct_endpoints = {endpoint for _, endpoint in resolved}
+        if len(distinct_endpoints) > 1:
+            workers = min(max_workers, len(distinct_endpoints))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(get_endpoint_connection, endpoint)
+                    for endpoint in distinct_endpoints
+                ]
+                for future in futures:
+                    # Wait without raising: a failed warm-up is not cached, so
+                    # the serial pass below retries and surfaces the error in
+                    # input order with full context.
+                    future.exception()
+
+        return [
+            self.quick_connect(param_set, endpoint, silent=silent)
+            for param_set, endpoint in resolved
+        ]
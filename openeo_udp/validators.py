@@ -4,10 +4,56 @@ Provides validation functions for spatial extents, temporal ranges, band lists,
 and other common parameter types used in OpenEO processing workflows.
 """
 
+import functools
 import re
-from datetime import date, datetime
+import time
+from datetime import date
 from typing import Any, Dict, List, Optional
 
+# Compiled once; validate_date_string runs per date in bulk temporal checks
+# and re.match's per-call cache lookup adds up. The explicit pattern also
+# keeps the strict YYYY-MM-DD contract on Python 3.11+, where
+# fromisoformat alone accepts looser ISO 8601 variants.
+_ISO_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+# Square of the ~111 km/degree equatorial approximation, folded once.
+_DEG_TO_KM_SQ = 111.0 * 111.0
+
+
+# date.today() goes through a syscall-backed clock read; batch validation
+# loops call it per interval. Serve a cached value refreshed at most once a
+# second — more than fresh enough for a day-granularity comparison.
+_TODAY_CACHE = (0.0, date.min)
+
+
+def _today() -> date:
+    global _TODAY_CACHE
+    stamp, cached = _TODAY_CACHE
+    now = time.monotonic()
+    if cached is date.min or now - stamp > 1.0:
+        cached = date.today()
+        _TODAY_CACHE = (now, cached)
+    return cached
+
+
+@functools.lru_cache(maxsize=256)
+def _normalize_band_name(band: str) -> str:
+    """Normalize a band string to B-prefixed uppercase, memoized.
+
+    Only ~13 distinct band names (times a few case/prefix spellings) ever
+    occur, so after warm-up every call is a cache hit.
+    """
+    # Handle reflectance format: "reflectance|b02" -> "b02"
+    if "|" in band:
+        band = band.rsplit("|", 1)[-1]
+
+    # Convert to uppercase and ensure B prefix
+    band = band.upper()
+    if not band.startswith("B"):
+        band = "B" + band
+
+    return band
+
 
 class ValidationError(Exception):
     """Custom exception for parameter validation errors."""
@@ -33,24 +79,28 @@ class SpatialValidator:
             ValidationError: If bbox is invalid and strict=True
         """
         try:
-            # Check required keys
-            required_keys = ["west", "east", "north", "south"]
-            if not all(key in bbox for key in required_keys):
-                raise ValidationError(
-                    f"Missing required keys. Expected: {required_keys}"
+            # Extract values; a KeyError doubles as the missing-key check, so
+            # the happy path does four lookups total instead of a membership
+            # scan followed by four more lookups.
+            try:
+                west, east, north, south = (
+                    bbox["west"],
+                    bbox["east"],
+                    bbox["north"],
+                    bbox["south"],
                 )
-
-            # Extract values
-            west, east, north, south = (
-                bbox["west"],
-                bbox["east"],
-                bbox["north"],
-                bbox["south"],
-            )
-
-            # Check types
-            if not all(
-                isinstance(val, (int, float)) for val in [west, east, north, south]
+            except KeyError:
+                raise ValidationError(
+                    "Missing required keys. Expected: ['west', 'east', 'north', 'south']"
+                ) from None
+
+            # Check types (straight-line and-chain, no generator per call)
+            num = (int, float)
+            if not (
+                isinstance(west, num)
+                and isinstance(east, num)
+                and isinstance(north, num)
+                and isinstance(south, num)
             ):
                 raise ValidationError("All bbox values must be numeric")
 
@@ -97,12 +147,12 @@ class SpatialValidator:
         if max_area_km2 is None:
             return True
 
-        # Rough area calculation (degrees to km conversion)
+        # Rough area calculation (degrees to km conversion); abs() keeps the
+        # comparison meaningful for antimeridian-crossing boxes where the raw
+        # width comes out negative.
         width_deg = bbox["east"] - bbox["west"]
         height_deg = bbox["north"] - bbox["south"]
-
-        # Approximate conversion: 1 degree ≈ 111 km at equator
-        area_km2 = width_deg * height_deg * 111 * 111
+        area_km2 = abs(width_deg * height_deg) * _DEG_TO_KM_SQ
 
         if area_km2 > max_area_km2:
             raise ValidationError(
@@ -115,6 +165,26 @@ class SpatialValidator:
 class TemporalValidator:
     """Validator for temporal extent parameters."""
 
+    @staticmethod
+    def _parse_iso_date(date_str: str) -> date:
+        """Parse and validate a YYYY-MM-DD string, returning the date.
+
+        Shared by validate_date_string and validate_temporal_range so each
+        string is parsed exactly once.
+
+        Raises:
+            ValidationError: If format or value is invalid
+        """
+        if not _ISO_DATE_RE.match(date_str):
+            raise ValidationError(
+                f"Invalid date format: {date_str}. Expected YYYY-MM-DD"
+            )
+
+        try:
+            return date.fromisoformat(date_str)
+        except ValueError as e:
+            raise ValidationError(f"Invalid date value: {date_str} - {e}") from e
+
     @staticmethod
     def validate_date_string(date_str: str) -> bool:
         """Validate date string format (ISO 8601: YYYY-MM-DD).
@@ -128,18 +198,8 @@ class TemporalValidator:
         Raises:
             ValidationError: If date format is invalid
         """
-        iso_pattern = r"^\d{4}-\d{2}-\d{2}$"
-
-        if not re.match(iso_pattern, date_str):
-            raise ValidationError(
-                f"Invalid date format: {date_str}. Expected YYYY-MM-DD"
-            )
-
-        try:
-            datetime.fromisoformat(date_str)
-            return True
-        except ValueError as e:
-            raise ValidationError(f"Invalid date value: {date_str} - {e}") from e
+        TemporalValidator._parse_iso_date(date_str)
+        return True
 
     @staticmethod
     def validate_temporal_range(
@@ -164,13 +224,10 @@ class TemporalValidator:
 
         start_str, end_str = temporal_extent
 
-        # Validate individual dates
-        TemporalValidator.validate_date_string(start_str)
-        TemporalValidator.validate_date_string(end_str)
-
-        # Check temporal order
-        start_date = datetime.fromisoformat(start_str).date()
-        end_date = datetime.fromisoformat(end_str).date()
+        # Validate and parse each date once; reuse the parsed objects for the
+        # order/duration checks below.
+        start_date = TemporalValidator._parse_iso_date(start_str)
+        end_date = TemporalValidator._parse_iso_date(end_str)
 
         if start_date > end_date:
             raise ValidationError(
@@ -186,7 +243,7 @@ class TemporalValidator:
                 )
 
         # Check for reasonable date range (not too far in future)
-        today = date.today()
+        today = _today()
         if start_date > today:
             # Allow some future dates for planning, but warn for very distant futures
             days_in_future = (start_date - today).days
@@ -218,6 +275,11 @@ class BandValidator:
         "B12": {"name": "SWIR 2", "center_wavelength": 2190, "resolution": 20},
     }
 
+    # Hoisted once at class creation: frozenset for membership checks, tuple
+    # for error messages (no per-failure list(keys()) allocation).
+    _BAND_KEYS = frozenset(SENTINEL2_BANDS)
+    _BAND_NAMES = tuple(SENTINEL2_BANDS)
+
     @staticmethod
     def normalize_band_name(band: str) -> str:
         """Normalize band name to standard format (e.g., 'b02' -> 'B02').
@@ -228,16 +290,7 @@ class BandValidator:
         Returns:
             Normalized band name
         """
-        # Handle reflectance format: "reflectance|b02" -> "B02"
-        if "|" in band:
-            band = band.split("|")[-1]
-
-        # Convert to uppercase and ensure B prefix
-        band = band.upper()
-        if not band.startswith("B"):
-            band = "B" + band
-
-        return band
+        return _normalize_band_name(band)
 
     @staticmethod
     def validate_band_list(
@@ -267,17 +320,13 @@ class BandValidator:
             if not isinstance(band, str):
                 raise ValidationError(f"Band names must be strings, got: {type(band)}")
 
-            # Handle different formats
-            if "|" in band:
-                # Reflectance format: validate the band part
-                _, band_part = band.split("|", 1)
-                normalized_band = BandValidator.normalize_band_name(band_part)
-            else:
-                normalized_band = BandValidator.normalize_band_name(band)
+            # The normalizer strips a reflectance|-style prefix itself; no
+            # need to pre-split here.
+            normalized_band = _normalize_band_name(band)
 
             # Check if band exists in Sentinel-2
-            if normalized_band not in BandValidator.SENTINEL2_BANDS:
-                available = list(BandValidator.SENTINEL2_BANDS.keys())
+            if normalized_band not in BandValidator._BAND_KEYS:
+                available = list(BandValidator._BAND_NAMES)
                 raise ValidationError(
                     f"Unknown band: {band} (normalized: {normalized_band}). "
                     f"Available Sentinel-2 bands: {available}"
@@ -285,12 +334,13 @@ class BandValidator:
 
             normalized_bands.append(normalized_band)
 
-        # Check for required bands
+        # Check for required bands; the normalized form of a given
+        # requirements list is cached, since the same algorithm spec is
+        # validated over and over.
         if required_bands:
-            required_normalized = [
-                BandValidator.normalize_band_name(b) for b in required_bands
-            ]
-            missing_bands = set(required_normalized) - set(normalized_bands)
+            missing_bands = _normalize_required(tuple(required_bands)) - set(
+                normalized_bands
+            )
 
             if missing_bands:
                 context = f" for {algorithm_name}" if algorithm_name else ""
@@ -319,6 +369,67 @@ class BandValidator:
         return BandValidator.SENTINEL2_BANDS[normalized_band]
 
 
+@functools.lru_cache(maxsize=64)
+def _normalize_required(required_bands: tuple) -> frozenset:
+    """Normalized form of a required-bands tuple, cached per distinct spec."""
+    return frozenset(
+        BandValidator.normalize_band_name(band) for band in required_bands
+    )
+
+
+# Per-type handlers for validate_parameter_value; dispatched through a dict
+# so each call is a single hash lookup instead of walking an elif chain.
+
+
+def _v_spatial_bbox(value: Any, rules: Dict) -> None:
+    SpatialValidator.validate_bbox(value, strict=True)
+    if "max_area_km2" in rules:
+        SpatialValidator.validate_area_size(value, rules["max_area_km2"])
+
+
+def _v_temporal_range(value: Any, rules: Dict) -> None:
+    TemporalValidator.validate_temporal_range(value, rules.get("max_duration_days"))
+
+
+def _v_band_list(value: Any, rules: Dict) -> None:
+    BandValidator.validate_band_list(
+        value, rules.get("required_bands"), rules.get("algorithm_name")
+    )
+
+
+def _v_string(value: Any, rules: Dict) -> None:
+    if not isinstance(value, str):
+        raise ValidationError(f"Expected string, got {type(value)}")
+
+
+def _v_number(value: Any, rules: Dict) -> None:
+    if not isinstance(value, (int, float)):
+        raise ValidationError(f"Expected number, got {type(value)}")
+
+    if "min_value" in rules and value < rules["min_value"]:
+        raise ValidationError(f"Value {value} below minimum {rules['min_value']}")
+
+    if "max_value" in rules and value > rules["max_value"]:
+        raise ValidationError(f"Value {value} above maximum {rules['max_value']}")
+
+
+def _v_generic(value: Any, rules: Dict) -> None:
+    # Generic validation - just check the value is not None
+    if value is None:
+        raise ValidationError("Parameter value cannot be None")
+
+
+_TYPE_DISPATCH = {
+    "spatial_bbox": _v_spatial_bbox,
+    "temporal_range": _v_temporal_range,
+    "band_list": _v_band_list,
+    "string": _v_string,
+    "str": _v_string,
+    "number": _v_number,
+    "float": _v_number,
+}
+
+
 def validate_parameter_value(
     param_type: str, value: Any, validation_rules: Optional[Dict] = None
 ) -> bool:
@@ -335,39 +446,6 @@ def validate_parameter_value(
     Raises:
         ValidationError: If validation fails
     """
-    rules = validation_rules or {}
-
-    if param_type == "spatial_bbox":
-        SpatialValidator.validate_bbox(value, strict=True)
-        if "max_area_km2" in rules:
-            SpatialValidator.validate_area_size(value, rules["max_area_km2"])
-
-    elif param_type == "temporal_range":
-        max_duration = rules.get("max_duration_days")
-        TemporalValidator.validate_temporal_range(value, max_duration)
-
-    elif param_type == "band_list":
-        required_bands = rules.get("required_bands")
-        algorithm_name = rules.get("algorithm_name")
-        BandValidator.validate_band_list(value, required_bands, algorithm_name)
-
-    elif param_type in ["string", "str"]:
-        if not isinstance(value, str):
-            raise ValidationError(f"Expected string, got {type(value)}")
-
-    elif param_type in ["number", "float"]:
-        if not isinstance(value, (int, float)):
-            raise ValidationError(f"Expected number, got {type(value)}")
-
-        if "min_value" in rules and value < rules["min_value"]:
-            raise ValidationError(f"Value {value} below minimum {rules['min_value']}")
-
-        if "max_value" in rules and value > rules["max_value"]:
-            raise ValidationError(f"Value {value} above maximum {rules['max_value']}")
-
-    else:
-        # Generic validation - just check the value is not None
-        if value is None:
-            raise ValidationError("Parameter value cannot be None")
-
+    handler = _TYPE_DISPATCH.get(param_type, _v_generic)
+    handler(value, validation_rules or {})
     return True
@@ -4,11 +4,72 @@ Interactive widgets for OpenEO UDP notebooks.
 This module provides reusable UI components for parameter selection and backend connection.
 """
 
-import ipywidgets as widgets
-import openeo
-from IPython.display import clear_output, display
+from __future__ import annotations
 
-from .endpoints import get_all_endpoints
+import threading
+import time
+import traceback
+from typing import TYPE_CHECKING
+
+from .endpoints import get_all_endpoints, get_enabled_endpoints
+
+if TYPE_CHECKING:
+    import openeo
+
+# ipywidgets and IPython are imported inside interactive_parameter_selection:
+# they are only needed once a widget is actually built, and non-interactive
+# users (quick_connect) should not pay their import cost just for importing
+# this package.
+
+# Formatted endpoint dropdown options, keyed by the enabled-endpoint tuple.
+# get_enabled_endpoints() returns the same cached tuple until
+# clear_endpoint_cache() resets it, so the key is stable and re-running a
+# widget cell reuses the formatted labels instead of rebuilding them.
+_ENDPOINT_OPTIONS_CACHE: dict = {}
+
+# Sentinel distinguishing "no .default attribute" from a default of None.
+_NO_DEFAULT = object()
+
+
+class _ConnectionState:
+    """Mutable connection state shared between the click handler and get_results.
+
+    Slotted like ParameterManager: attribute access beats string-keyed dict
+    probes in the handler, and a fixed field set catches typos at runtime.
+    """
+
+    __slots__ = (
+        "connection",
+        "current_params",
+        "selected_endpoint",
+        "in_flight",
+        "last_click",
+    )
+
+    def __init__(self):
+        self.connection = None
+        self.current_params = None
+        self.selected_endpoint = None
+        # Click guards: the button disable is a frontend round trip, so a
+        # fast double-click can still deliver two events (see on_connect_click).
+        self.in_flight = False
+        self.last_click = 0.0
+
+
+def _endpoint_options(available_endpoints, endpoint_config):
+    """Build (label, name) dropdown options for the enabled endpoints, memoized."""
+    options = _ENDPOINT_OPTIONS_CACHE.get(available_endpoints)
+    if options is None:
+        options = [
+            (
+                f"{endpoint} "
+                f"({endpoint_config[endpoint].get('url', 'URL not specified')})",
+                endpoint,
+            )
+            for endpoint in available_endpoints
+        ]
+        _ENDPOINT_OPTIONS_CACHE[available_endpoints] = options
+    return options
 
 
 def interactive_parameter_selection(
@@ -43,39 +104,43 @@ def interactive_parameter_selection(
     >>> # Widgets are automatically displayed, user clicks connect
     >>> connection, params = get_results()
     """
+    import ipywidgets as widgets
+    from IPython.display import clear_output, display
 
     # Clear any existing outputs from previous runs
     clear_output(wait=True)
 
-    # Get available parameter sets and endpoints
+    # Get available parameter sets and endpoints; both the assembled config
+    # dict and the enabled-name tuple are cached in the endpoints package, so
+    # re-running the widget cell costs two lookups.
     available_sets = param_manager.list_parameter_sets()
     endpoint_config = get_all_endpoints()
-    available_endpoints = [
-        name for name, config in endpoint_config.items() if config.get("enabled", True)
-    ]
-
-    # Set defaults
-    default_param = default_param_set or available_sets[0] if available_sets else None
-    default_ep = default_endpoint or (
-        available_endpoints[0] if available_endpoints else "eopf_explorer"
-    )
-
-    # Create dropdown options
+    available_endpoints = get_enabled_endpoints()
+
+    # Set defaults. An explicit caller value always wins; the fallback chain
+    # only applies when the corresponding argument was omitted. (The previous
+    # one-liner parsed as "(caller or first) if available else None", silently
+    # discarding a caller-provided default when no sets were loaded.)
+    if default_param_set is not None:
+        default_param = default_param_set
+    else:
+        default_param = available_sets[0] if available_sets else None
+    if default_endpoint is not None:
+        default_ep = default_endpoint
+    else:
+        default_ep = available_endpoints[0] if available_endpoints else "eopf_explorer"
+
+    # Create dropdown options in one pass over the loaded sets (no per-set
+    # getter round trip or intermediate list).
     param_options = [
         (f"{params.get('location_name', name)}", name)
-        for name, params in [
-            (set_name, param_manager.get_parameter_set(set_name))
-            for set_name in available_sets
-        ]
+        for name, params in param_manager._parameter_sets.items()
     ]
+    # Reverse lookup for on_connect_click; O(1) per click instead of a scan
+    # over the registered locations.
+    display_names = {name: display for display, name in param_options}
 
-    endpoint_options = [
-        (
-            f"{endpoint} ({endpoint_config[endpoint].get('url', 'URL not specified')})",
-            endpoint,
-        )
-        for endpoint in available_endpoints
-    ]
+    endpoint_options = _endpoint_options(available_endpoints, endpoint_config)
 
     # Create widgets
     endpoint_dropdown = widgets.Dropdown(
@@ -103,70 +168,96 @@ def interactive_parameter_selection(
     output = widgets.Output()
 
     # Storage for connection and parameters
-    state = {"connection": None, "current_params": None, "selected_endpoint": None}
+    state = _ConnectionState()
+
+    def _do_connect(selected_param_set, selected_endpoint, selected_location_name):
+        # Accumulate status lines and emit them through the widget model in a
+        # single append_stdout call. Stream prints (even inside `with output:`)
+        # are routed by the kernel's *current* parent message, which for a
+        # background thread is whatever cell happens to be executing when the
+        # print lands — append_stdout writes the Output widget directly, so
+        # the text always reaches this widget's cell, in one comm message.
+        lines = ["🔄 Starting connection process..."]
+
+        try:
+            # Apply parameter set
+            param_manager.use_parameter_set(selected_param_set)
+            lines.append(f"✓ Parameter set applied: {selected_location_name}")
+
+            # Get parameter set and apply endpoint mapping
+            raw_params = param_manager.get_parameter_set()
+            state.current_params = param_manager.apply_endpoint_mapping(
+                raw_params, selected_endpoint
+            )
+            lines.append(
+                f"✓ Parameters loaded and mapped for endpoint: {selected_endpoint}"
+            )
+
+            # Connect to endpoint
+            lines.append(f"🔗 Connecting to {selected_endpoint}...")
+
+            # Use endpoint-specific connection function
+            from .endpoints import get_endpoint_connection
+
+            connection = get_endpoint_connection(selected_endpoint)
+
+            state.connection = connection
+            state.selected_endpoint = selected_endpoint
+            lines.append("✅ Connected successfully!")
+
+            # Display parameter details. Single getattr with a sentinel
+            # fallback instead of a hasattr probe plus attribute access.
+            lines.append("\n📊 Parameter Details:")
+            for key, value in state.current_params.items():
+                if key != "location_name":
+                    default = getattr(value, "default", _NO_DEFAULT)
+                    lines.append(
+                        f"  {key}: {value if default is _NO_DEFAULT else default}"
+                    )
+
+            lines.append("\n✨ Ready to proceed!")
+
+        except Exception as e:
+            lines.append(f"❌ Error: {str(e)}")
+            # Bound the frame walk: eight frames reach back through the
+            # mapper/manager layers, which is plenty for diagnosis.
+            lines.append(f"Details: {traceback.format_exc(limit=8)}")
+        finally:
+            output.append_stdout("\n".join(lines) + "\n")
+            state.in_flight = False
+            connect_button.disabled = False
 
     def on_connect_click(b):
-        # Clear output and disable button
-        output.clear_output(wait=True)
+        # Drop re-entrant and rapid repeat clicks: events queued before the
+        # button disable landed would otherwise start a second OIDC flow.
+        now = time.monotonic()
+        if state.in_flight or now - state.last_click < 0.25:
+            return
+        state.in_flight = True
+        state.last_click = now
+
+        # Clear output and disable button. Resetting the outputs trait drops
+        # the previous run's text without clear_output's stream bookkeeping,
+        # which is not thread-safe against the worker's append_stdout.
+        output.outputs = ()
         connect_button.disabled = True
 
         selected_param_set = param_dropdown.value
         selected_endpoint = endpoint_dropdown.value
 
         # Get the display name for the selected parameter set
-        selected_location_name = "Unknown Location"
-        for display_name, param_name in param_options:
-            if param_name == selected_param_set:
-                selected_location_name = display_name
-                break
-
-        with output:
-            print("🔄 Starting connection process...")
-
-            try:
-                # Apply parameter set
-                param_manager.use_parameter_set(selected_param_set)
-                print(f"✓ Parameter set applied: {selected_location_name}")
-
-                # Get parameter set and apply endpoint mapping
-                raw_params = param_manager.get_parameter_set()
-                state["current_params"] = param_manager.apply_endpoint_mapping(
-                    raw_params, selected_endpoint
-                )
-                print(
-                    f"✓ Parameters loaded and mapped for endpoint: {selected_endpoint}"
-                )
-
-                # Connect to endpoint
-                print(f"🔗 Connecting to {selected_endpoint}...")
-
-                # Use endpoint-specific connection function
-                from .endpoints import get_endpoint_connection
-
-                connection = get_endpoint_connection(selected_endpoint)
-
-                state["connection"] = connection
-                state["selected_endpoint"] = selected_endpoint
-                print("✅ Connected successfully!")
-
-                # Display parameter details
-                print("\n📊 Parameter Details:")
-                for key, value in state["current_params"].items():
-                    if key != "location_name":
-                        if hasattr(value, "default"):
-                            print(f"  {key}: {value.default}")
-                        else:
-                            print(f"  {key}: {value}")
-
-                print("\n✨ Ready to proceed!")
-
-            except Exception as e:
-                print(f"❌ Error: {str(e)}")
-                import traceback
-
-                print(f"Details: {traceback.format_exc()}")
-            finally:
-                connect_button.disabled = False
+        selected_location_name = display_names.get(
+            selected_param_set, "Unknown Location"
+        )
+
+        # Run the connection (network round trips plus OIDC) off the kernel
+        # thread so the notebook stays responsive while it completes; the
+        # worker writes its status into the Output widget model directly.
+        threading.Thread(
+            target=_do_connect,
+            args=(selected_param_set, selected_endpoint, selected_location_name),
+            daemon=True,
+        ).start()
 
     # Attach the handler to the button
     connect_button.on_click(on_connect_click)
@@ -181,11 +272,11 @@ def interactive_parameter_selection(
     # Return a simple function that gets the connection and parameters as a tuple
     def get_results() -> tuple[openeo.Connection, dict]:
         """Get the connection and parameters as a tuple."""
-        if state["connection"] is None:
+        if state.connection is None:
             print(
                 "⚠️ No connection found. Please click 'Connect & Load Parameters' first."
             )
             return None, None
-        return state["connection"], state["current_params"]
+        return state.connection, state.current_params
 
     return get_results
@@ -8,26 +8,23 @@ This test suite covers:
 - Parameter validation
 """
 
-import os
-import tempfile
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock
 
+import openeo
 import pytest
 from openeo.api.process import Parameter
 
 # Import the modules to test
-from openeo_udp import ParameterManager
+from openeo_udp import ParameterManager, endpoints
 from openeo_udp.collections import (
     UnsupportedBandError,
     UnsupportedCollectionError,
 )
 from openeo_udp.endpoints import get_all_endpoints
 
-
-@pytest.fixture
-def sample_params_content():
-    """Sample parameter file content for testing."""
-    return """
+# Sample parameter file content shared by the file fixtures; a module-level
+# constant so no test pays a fixture resolution just to read a literal.
+SAMPLE_PARAMS_CONTENT = """
 from openeo.api.process import Parameter
 
 def get_parameters():
@@ -52,18 +49,49 @@ def get_parameters():
 """
 
 
+@pytest.fixture(scope="session")
+def temp_params_file(tmp_path_factory):
+    """Write the params file once for the whole session.
+
+    The content is a constant and no test mutates the file, so every test can
+    share one copy instead of paying a tempfile create/write/unlink cycle
+    each; pytest reaps the tmp_path_factory directory at session end.
+    """
+    params_file = tmp_path_factory.mktemp("params") / "test.params.py"
+    params_file.write_text(SAMPLE_PARAMS_CONTENT)
+    return str(params_file)
+
+
+@pytest.fixture(scope="session")
+def _session_manager(temp_params_file):
+    """One ParameterManager for the whole session; construction is read-only."""
+    return ParameterManager(temp_params_file)
+
+
+@pytest.fixture
+def manager(_session_manager):
+    """Shared manager with the mutable selection state reset per test."""
+    _session_manager._current_set = None
+    return _session_manager
+
+
 @pytest.fixture
-def temp_params_file(sample_params_content):
-    """Create a temporary params file for testing."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(sample_params_content)
-        params_file = f.name
+def param_manager(manager):
+    """Alias for the shared manager, matching the mapping tests' naming."""
+    return manager
+
 
-    yield params_file
+# One connection mock shared by the connection tests; Mock construction sets up
+# a fair amount of machinery, so the fixture hands out the same instance and
+# wipes its state afterwards instead of building a fresh one per test.
+_SHARED_CONNECTION = MagicMock()
 
-    # Cleanup
-    if os.path.exists(params_file):
-        os.unlink(params_file)
+
+@pytest.fixture
+def mock_connection():
+    """The shared connection mock, reset after each test."""
+    yield _SHARED_CONNECTION
+    _SHARED_CONNECTION.reset_mock(return_value=True, side_effect=True)
 
 
 class TestParameterManager:
@@ -80,25 +108,31 @@ class TestParameterManager:
         with pytest.raises(FileNotFoundError):
             ParameterManager("nonexistent_file.py")
 
-    def test_list_parameter_sets(self, temp_params_file):
+    def test_list_parameter_sets(self, manager):
         """Test listing available parameter sets."""
-        manager = ParameterManager(temp_params_file)
         sets = manager.list_parameter_sets()
         assert "venice_lagoon" in sets
         assert "lake_victoria" in sets
         assert len(sets) == 2
 
-    def test_get_parameter_set(self, temp_params_file):
+    @pytest.mark.parametrize(
+        "set_name,expected_location,expected_west",
+        [
+            ("venice_lagoon", "Venice Lagoon", 12.0),
+            ("lake_victoria", "Lake Victoria", 31.5),
+        ],
+    )
+    def test_get_parameter_set(
+        self, manager, set_name, expected_location, expected_west
+    ):
         """Test getting a specific parameter set."""
-        manager = ParameterManager(temp_params_file)
-        params = manager.get_parameter_set("venice_lagoon")
-        assert params["location_name"] == "Venice Lagoon"
-        assert hasattr(params["bounding_box"], "default")
-        assert params["bounding_box"].default["west"] == 12.0
+        params = manager.get_parameter_set(set_name)
+        assert params["location_name"] == expected_location
+        assert isinstance(params["bounding_box"], Parameter)
+        assert params["bounding_box"].default["west"] == expected_west
 
-    def test_use_parameter_set(self, temp_params_file):
+    def test_use_parameter_set(self, manager):
         """Test switching to a different parameter set."""
-        manager = ParameterManager(temp_params_file)
 
         # Switch to lake_victoria
         manager.use_parameter_set("lake_victoria")
@@ -110,13 +144,12 @@ class TestParameterManager:
         params = manager.get_parameter_set()
         assert params["location_name"] == "Venice Lagoon"
 
-    def test_get_parameter(self, temp_params_file):
+    def test_get_parameter(self, manager):
         """Test getting a specific parameter from the current set."""
-        manager = ParameterManager(temp_params_file)
         manager.use_parameter_set("venice_lagoon")
 
         bbox = manager.get_parameter("bounding_box")
-        assert hasattr(bbox, "default")
+        assert isinstance(bbox, Parameter)
         assert bbox.default == {
             "west": 12.0,
             "south": 45.3,
@@ -125,19 +158,17 @@ class TestParameterManager:
         }
 
         time_param = manager.get_parameter("time")
-        assert hasattr(time_param, "default")
+        assert isinstance(time_param, Parameter)
         assert time_param.default == ["2023-06-01", "2023-06-30"]
 
-    def test_parameter_set_not_found(self, temp_params_file):
+    def test_parameter_set_not_found(self, manager):
         """Test handling of non-existent parameter set."""
-        manager = ParameterManager(temp_params_file)
 
         with pytest.raises(ValueError):
             manager.use_parameter_set("nonexistent_set")
 
-    def test_parameter_not_found(self, temp_params_file):
+    def test_parameter_not_found(self, manager):
         """Test handling of non-existent parameter."""
-        manager = ParameterManager(temp_params_file)
         manager.use_parameter_set("venice_lagoon")
 
         with pytest.raises(ValueError):
@@ -185,9 +216,9 @@ class TestParameterManagerMethods:
     """Test cases for ParameterManager widget and helper methods."""
 
     @pytest.fixture
-    def mock_param_manager(self, temp_params_file):
-        """Create a real ParameterManager for testing."""
-        return ParameterManager(temp_params_file)
+    def mock_param_manager(self, manager):
+        """The shared session manager, reset for each test."""
+        return manager
 
     def test_print_options(self, mock_param_manager, capsys):
         """Test print_options helper method."""
@@ -210,13 +241,11 @@ class TestParameterManagerMethods:
         # Should return a callable function
         assert callable(result)
 
-    @patch("openeo.connect")
-    def test_quick_connect_success(self, mock_connect, mock_param_manager):
+    def test_quick_connect_success(self, monkeypatch, mock_param_manager, mock_connection):
         """Test successful quick connection."""
         # Mock successful connection
-        mock_connection = Mock()
-        mock_connect.return_value = mock_connection
-        mock_connection.authenticate_oidc_authorization_code = Mock()
+        monkeypatch.setattr(openeo, "connect", Mock(return_value=mock_connection))
+        endpoints.invalidate_connection()
 
         connection, params = mock_param_manager.quick_connect(
             param_set="venice_lagoon", endpoint="eopf_explorer", silent=True
@@ -226,11 +255,10 @@ class TestParameterManagerMethods:
         assert "location_name" in params
         assert params["location_name"] == "Venice Lagoon"
 
-    @patch("openeo_udp.endpoints.get_endpoint_connection")
-    def test_quick_connect_with_defaults(self, mock_get_connection, mock_param_manager):
+    def test_quick_connect_with_defaults(self, monkeypatch, mock_param_manager, mock_connection):
         """Test quick connection with default parameters."""
-        mock_connection = Mock()
-        mock_get_connection.return_value = mock_connection
+        mock_get_connection = Mock(return_value=mock_connection)
+        monkeypatch.setattr(endpoints, "get_endpoint_connection", mock_get_connection)
 
         connection, params = mock_param_manager.quick_connect(silent=True)
 
@@ -239,15 +267,55 @@ class TestParameterManagerMethods:
         assert params["location_name"] in ["Venice Lagoon", "Lake Victoria"]
         mock_get_connection.assert_called_once()
 
-    @patch("openeo_udp.endpoints.get_endpoint_connection")
-    def test_quick_connect_failure(self, mock_get_connection, mock_param_manager):
+    def test_quick_connect_failure(self, monkeypatch, mock_param_manager):
         """Test quick connection failure handling."""
         # Mock connection failure
-        mock_get_connection.side_effect = Exception("Connection failed")
+        monkeypatch.setattr(
+            endpoints,
+            "get_endpoint_connection",
+            Mock(side_effect=Exception("Connection failed")),
+        )
 
         with pytest.raises(Exception, match="Connection failed"):
             mock_param_manager.quick_connect(silent=True)
 
+    def test_quick_connect_many_returns_results_in_order(
+        self, monkeypatch, mock_param_manager
+    ):
+        """Batch connect returns (connection, params) per pair, in input order."""
+        connections = {"eopf_explorer": Mock(), "ds_development": Mock()}
+        monkeypatch.setattr(
+            endpoints, "get_endpoint_connection", lambda name: connections[name]
+        )
+
+        results = mock_param_manager.quick_connect_many(
+            [("venice_lagoon", "eopf_explorer"), ("lake_victoria", "ds_development")]
+        )
+
+        assert len(results) == 2
+        assert results[0][0] is connections["eopf_explorer"]
+        assert results[0][1]["location_name"] == "Venice Lagoon"
+        assert results[1][0] is connections["ds_development"]
+        assert results[1][1]["location_name"] == "Lake Victoria"
+
+    def test_quick_connect_many_failure_surfaces(
+        self, monkeypatch, mock_param_manager
+    ):
+        """A connection failure swallowed during warm-up re-raises serially."""
+        monkeypatch.setattr(
+            endpoints,
+            "get_endpoint_connection",
+            Mock(side_effect=Exception("Connection failed")),
+        )
+
+        with pytest.raises(Exception, match="Connection failed"):
+            mock_param_manager.quick_connect_many(
+                [
+                    ("venice_lagoon", "eopf_explorer"),
+                    ("lake_victoria", "ds_development"),
+                ]
+            )
+
 
 class TestParameterValidation:
     """Test cases for parameter validation."""
@@ -267,9 +335,8 @@ class TestParameterValidation:
         assert "east" in bbox_param.default
         assert "north" in bbox_param.default
 
-    def test_parameter_set_structure(self, temp_params_file):
+    def test_parameter_set_structure(self, manager):
         """Test that parameter sets have the expected structure."""
-        manager = ParameterManager(temp_params_file)
         param_set = manager.get_parameter_set("venice_lagoon")
 
         expected_keys = [
@@ -286,93 +353,66 @@ class TestParameterValidation:
 
             if key != "location_name":
                 # All parameters except location_name should be Parameter objects
-                assert hasattr(param_set[key], "default")
+                assert isinstance(param_set[key], Parameter)
 
 
 class TestParameterMapping:
     """Test cases for endpoint parameter mapping."""
 
-    def test_eopf_explorer_mapping(self, temp_params_file):
-        """Test parameter mapping for EOPF Explorer endpoint."""
-        param_manager = ParameterManager(temp_params_file)
-        param_manager.use_parameter_set("venice_lagoon")
-        raw_params = param_manager.get_parameter_set()
-
-        # Apply EOPF Explorer mapping
-        mapped_params = param_manager.apply_endpoint_mapping(
-            raw_params, "eopf_explorer"
-        )
-
-        # Check collection mapping
-        assert mapped_params["collection"].default == "sentinel-2-l2a"
-
-        # Check band mapping (should have reflectance prefix and lowercase)
-        expected_bands = [
-            "reflectance|b02",
-            "reflectance|b03",
-            "reflectance|b04",
-            "reflectance|b05",
-            "reflectance|b08",
-            "reflectance|b8a",
-            "reflectance|b11",
-        ]
-        assert mapped_params["bands"].default == expected_bands
-
-    def test_copernicus_dataspace_mapping(self, temp_params_file):
-        """Test parameter mapping for Copernicus Data Space endpoint."""
-        param_manager = ParameterManager(temp_params_file)
+    @pytest.mark.parametrize(
+        "endpoint,expected_collection,expected_bands",
+        [
+            # EOPF Explorer: reflectance-prefixed lowercase bands.
+            (
+                "eopf_explorer",
+                "sentinel-2-l2a",
+                [
+                    "reflectance|b02",
+                    "reflectance|b03",
+                    "reflectance|b04",
+                    "reflectance|b05",
+                    "reflectance|b08",
+                    "reflectance|b8a",
+                    "reflectance|b11",
+                ],
+            ),
+            # CDSE: native SENTINEL2_L2A id with uppercase B-numbers.
+            (
+                "copernicus_dataspace",
+                "SENTINEL2_L2A",
+                ["B02", "B03", "B04", "B05", "B08", "B8A", "B11"],
+            ),
+            # DS development: resolution-suffixed native names (b02 -> B02_10m)
+            # via its COLLECTIONS table.
+            (
+                "ds_development",
+                "sentinel-2-l2a",
+                [
+                    "B02_10m",
+                    "B03_10m",
+                    "B04_10m",
+                    "B05_20m",
+                    "B08_10m",
+                    "B8A_20m",
+                    "B11_20m",
+                ],
+            ),
+        ],
+    )
+    def test_endpoint_mapping(
+        self, param_manager, endpoint, expected_collection, expected_bands
+    ):
+        """Each endpoint maps the canonical collection and bands to native names."""
         param_manager.use_parameter_set("venice_lagoon")
         raw_params = param_manager.get_parameter_set()
 
-        # Apply CDSE mapping
-        mapped_params = param_manager.apply_endpoint_mapping(
-            raw_params, "copernicus_dataspace"
-        )
+        mapped_params = param_manager.apply_endpoint_mapping(raw_params, endpoint)
 
-        # Check collection mapping (should map to native SENTINEL2_L2A)
-        assert mapped_params["collection"].default == "SENTINEL2_L2A"
-
-        # CDSE serves Sentinel-2 with uppercase B-numbers.
-        assert mapped_params["bands"].default == [
-            "B02",
-            "B03",
-            "B04",
-            "B05",
-            "B08",
-            "B8A",
-            "B11",
-        ]
-
-    def test_ds_development_mapping(self, temp_params_file):
-        """Test parameter mapping for Development Seed endpoint."""
-        param_manager = ParameterManager(temp_params_file)
-        param_manager.use_parameter_set("venice_lagoon")
-        raw_params = param_manager.get_parameter_set()
-
-        # Apply DS development mapping
-        mapped_params = param_manager.apply_endpoint_mapping(
-            raw_params, "ds_development"
-        )
-
-        # Check collection mapping
-        assert mapped_params["collection"].default == "sentinel-2-l2a"
-
-        # DS development maps each canonical band to a resolution-suffixed
-        # native name (e.g. b02 -> B02_10m) via its COLLECTIONS table.
-        expected_bands = [
-            "B02_10m",
-            "B03_10m",
-            "B04_10m",
-            "B05_20m",
-            "B08_10m",
-            "B8A_20m",
-            "B11_20m",
-        ]
+        assert mapped_params["collection"].default == expected_collection
         assert mapped_params["bands"].default == expected_bands
 
-    def test_unknown_endpoint_mapping(self, temp_params_file):
+    def test_unknown_endpoint_mapping(self, param_manager):
         """Test parameter mapping for unknown endpoint uses default mapper."""
-        param_manager = ParameterManager(temp_params_file)
         param_manager.use_parameter_set("venice_lagoon")
         raw_params = param_manager.get_parameter_set()
 
@@ -384,9 +424,8 @@ class TestParameterMapping:
         # Should return original parameters unchanged
         assert mapped_params == raw_params
 
-    def test_legacy_uppercase_collection_alias(self, temp_params_file):
+    def test_legacy_uppercase_collection_alias(self, param_manager):
         """Legacy uppercase collection ids still resolve via the alias map."""
-        param_manager = ParameterManager(temp_params_file)
         params = {
             "collection": Parameter(
                 "collection", description="c", default="SENTINEL2_L2A"
@@ -397,9 +436,8 @@ class TestParameterMapping:
         assert mapped["collection"].default == "sentinel-2-l2a"
         assert mapped["bands"].default == ["B04_10m"]
 
-    def test_sentinel1_mapping(self, temp_params_file):
+    def test_sentinel1_mapping(self, param_manager):
         """Sentinel-1 GRD canonical ids map to native collection + bands."""
-        param_manager = ParameterManager(temp_params_file)
         params = {
             "collection": Parameter(
                 "collection", description="c", default="sentinel-1-grd"
@@ -415,9 +453,8 @@ class TestParameterMapping:
         assert cdse["collection"].default == "SENTINEL1_GRD"
         assert cdse["bands"].default == ["VH", "VV"]
 
-    def test_unsupported_collection_raises(self, temp_params_file):
+    def test_unsupported_collection_raises(self, param_manager):
         """An unknown canonical collection raises rather than passing through."""
-        param_manager = ParameterManager(temp_params_file)
         params = {
             "collection": Parameter(
                 "collection", description="c", default="landsat-8-l2"
@@ -426,9 +463,8 @@ class TestParameterMapping:
         with pytest.raises(UnsupportedCollectionError):
             param_manager.apply_endpoint_mapping(params, "ds_development")
 
-    def test_unsupported_band_raises(self, temp_params_file):
+    def test_unsupported_band_raises(self, param_manager):
         """A band absent from the collection's band map raises."""
-        param_manager = ParameterManager(temp_params_file)
         params = {
             "collection": Parameter(
                 "collection", description="c", default="sentinel-2-l2a"
@@ -438,9 +474,8 @@ class TestParameterMapping:
         with pytest.raises(UnsupportedBandError):
             param_manager.apply_endpoint_mapping(params, "ds_development")
 
-    def test_band_name_map_resolves_canonical_to_native(self, temp_params_file):
+    def test_band_name_map_resolves_canonical_to_native(self, param_manager):
         """band_name_map zips canonical bands to their endpoint-native names."""
-        param_manager = ParameterManager(temp_params_file)
         param_manager.use_parameter_set("venice_lagoon")
         raw_params = param_manager.get_parameter_set()
 
@@ -449,11 +484,13 @@ class TestParameterMapping:
 
         assert bands["b04"] == "B04_10m"
         assert bands["b8a"] == "B8A_20m"
+
+
+class TestResolveParameters:
     """Test cases for resolve_parameters / resolve (graph parameter materialization)."""
 
-    def test_resolve_parameters_substitutes_user_refs(self, temp_params_file):
+    def test_resolve_parameters_substitutes_user_refs(self, manager):
         """A from_parameter ref whose name is in current_params is replaced by .default."""
-        manager = ParameterManager(temp_params_file)
         current = manager.get_parameter_set("venice_lagoon")
 
         graph = {
@@ -474,9 +511,8 @@ class TestParameterMapping:
         # Unchanged literal passes through.
         assert args["bands"] == ["B02"]
 
-    def test_resolve_parameters_preserves_callback_refs(self, temp_params_file):
+    def test_resolve_parameters_preserves_callback_refs(self, manager):
         """Placeholders like 'data'/'value'/'x' are NOT in current_params and must be preserved."""
-        manager = ParameterManager(temp_params_file)
         current = manager.get_parameter_set("venice_lagoon")
 
         graph = {
@@ -509,9 +545,8 @@ class TestParameterMapping:
         # User ref substituted even inside nested child process graphs.
         assert inner["y"] == current["cloud_cover"].default
 
-    def test_resolve_parameters_defaults_to_current_set(self, temp_params_file):
+    def test_resolve_parameters_defaults_to_current_set(self, manager):
         """When current_params is None, the method uses the manager's active set."""
-        manager = ParameterManager(temp_params_file)
         manager.use_parameter_set("lake_victoria")
 
         graph = {
@@ -525,9 +560,8 @@ class TestParameterMapping:
         expected = manager.get_parameter_set("lake_victoria")["bounding_box"].default
         assert resolved["n1"]["arguments"]["bbox"] == expected
 
-    def test_resolve_parameters_handles_plain_scalars(self, temp_params_file):
+    def test_resolve_parameters_handles_plain_scalars(self, manager):
         """Non-Parameter values in current_params (e.g. reflectance_scale) must also be substitutable."""
-        manager = ParameterManager(temp_params_file)
         current = {"reflectance_scale": 10000.0}  # plain scalar, no .default
 
         graph = {
@@ -539,9 +573,8 @@ class TestParameterMapping:
         resolved = manager.resolve_parameters(graph, current)
         assert resolved["n1"]["arguments"]["y"] == 10000.0
 
-    def test_resolve_returns_cube_from_flat_graph(self, temp_params_file):
+    def test_resolve_returns_cube_from_flat_graph(self, manager):
         """resolve(datacube) calls datacube_from_flat_graph with a parameter-free graph."""
-        manager = ParameterManager(temp_params_file)
         current = manager.get_parameter_set("venice_lagoon")
 
         mock_cube = Mock()
@@ -566,12 +599,12 @@ class TestParameterMapping:
 class TestIntegration:
     """Integration tests for the complete workflow."""
 
-    @patch("openeo_udp.endpoints.get_endpoint_connection")
-    def test_complete_workflow_simulation(self, mock_get_connection, temp_params_file):
+    def test_complete_workflow_simulation(self, monkeypatch, temp_params_file, mock_connection):
         """Test a complete workflow from parameter loading to connection."""
         # Mock external dependencies
-        mock_connection = Mock()
-        mock_get_connection.return_value = mock_connection
+        monkeypatch.setattr(
+            endpoints, "get_endpoint_connection", Mock(return_value=mock_connection)
+        )
 
         # Test complete workflow
         param_manager = ParameterManager(temp_params_file)